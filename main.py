@@ -8,7 +8,10 @@ redacted version highlighting detected PII/PHI entities.
 
 import streamlit as st
 import logging
-from redaction.service.pipeline import redact_text
+import time
+from concurrent.futures import ThreadPoolExecutor
+from redaction.core.exceptions import InitializationError
+from redaction.service.pipeline import redact_text, warmup
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -17,6 +20,29 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@st.cache_resource(show_spinner="Loading redaction engines...")
+def _warm_up_engines() -> None:
+    """Builds and warms the engine pool once per Streamlit process.
+
+    Streamlit re-executes this script on every widget interaction; caching
+    the call as a resource runs it once, while the pooled engines stay
+    loaded in the service layer across reruns and sessions. Failed
+    initializations are not cached, so the next rerun retries. Warming up
+    here means the first redaction does not pay for lazy model loading.
+    """
+    warmup()
+
+
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    """Returns the worker pool redaction jobs are offloaded to.
+
+    Cached as a resource because module-level objects in this script are
+    rebuilt on every rerun.
+    """
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="redaction")
+
+
 def main():
     """Run the Streamlit application UI.
 
@@ -34,6 +60,13 @@ def main():
     )
     st.markdown("---")
 
+    # Load and warm the engines on page load rather than on the first click;
+    # failures are reported when redaction is attempted.
+    try:
+        _warm_up_engines()
+    except Exception:
+        logger.error("Redaction engine warm-up failed", exc_info=True)
+
     col1, col2 = st.columns(2)
 
     with col1:
@@ -56,7 +89,15 @@ def main():
                 try:
                     with st.spinner("Analyzing document..."):
                         logger.info(f"Processing document of length: {len(text_input)}")
-                        result = redact_text(text_input)
+                        _warm_up_engines()
+                        # Run off the script thread and poll, so the spinner
+                        # keeps updating while long documents are processed.
+                        # redact_text() leases an idle engine from the pool,
+                        # so concurrent sessions never share one engine.
+                        future = _get_executor().submit(redact_text, text_input)
+                        while not future.done():
+                            time.sleep(0.05)
+                        result = future.result()
 
                     if "error" in result.metadata:
                         st.error(f"Redaction failed: {result.metadata['error']}")
@@ -78,6 +119,14 @@ def main():
                             extra={"text_length": len(text_input)},
                         )
 
+                except InitializationError:
+                    st.error("The redaction engine could not be initialized.")
+                    logger.error(
+                        "Redaction engine unavailable",
+                        exc_info=True,
+                        extra={"text_length": len(text_input)},
+                    )
+
                 except Exception:
                     st.error("An unexpected error occurred during redaction.")
                     logger.error(
@@ -2,6 +2,8 @@
 
 """Entity type constants for PII/PHI detection in Canadian healthcare documents."""
 
+import sys
+
 
 class EntityType:
     """Constants representing detectable PII/PHI entity types."""
@@ -34,3 +36,12 @@ class EntityType:
     TX_ID = "TRANSACTION_ID"
     BANK_NAME = "FINANCIAL_INSTITUTION"
     MRN = "MEDICAL_RECORD_NUMBER"
+
+
+# Intern every constant so entity types that flow through recognizers and
+# results share one object per value; str equality then short-circuits on
+# identity instead of comparing characters.
+for _name, _value in list(vars(EntityType).items()):
+    if not _name.startswith("_") and isinstance(_value, str):
+        setattr(EntityType, _name, sys.intern(_value))
+del _name, _value
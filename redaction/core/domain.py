@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class RedactedEntity:
     """Represents a single identified and redacted entity.
 
@@ -27,7 +27,7 @@ class RedactedEntity:
     rule_name: str = "Unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class RedactionResult:
     """Result object returned by the redaction service.
 
@@ -2,15 +2,55 @@
 
 """Configuration and pattern loader for redaction engine."""
 
+import functools
+import os
+import re
 import yaml
+import pickle
 import logging
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
 
 from redaction.core.exceptions import ConfigurationError
 
+try:
+    # libyaml C bindings; several times faster than the pure-Python parser
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+try:
+    # Presidio matches patterns with the third-party regex module (and newer
+    # releases pass it regex-only arguments such as timeout), so patterns are
+    # pre-compiled with the same engine to be handed over unchanged.
+    import regex as _regex_engine
+except ImportError:
+    _regex_engine = re  # type: ignore[no-redef]
+
 logger = logging.getLogger(__name__)
 
+# Environment variable redirecting the pre-parsed config sidecar (e.g. to a
+# writable or shared directory when the package itself is read-only).
+PATTERN_CACHE_DIR_ENV = "REDACTION_PATTERN_CACHE_DIR"
+
+# Flags used to pre-compile configured patterns. These match Presidio's
+# PatternRecognizer defaults so the compiled objects can be reused as-is.
+REGEX_FLAGS = re.DOTALL | re.MULTILINE | re.IGNORECASE
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_once(regex: str, flags: int = REGEX_FLAGS) -> Any:
+    """Compiles regex once per (source, flags) for the life of the process.
+
+    Identical expressions configured for different entity types share one
+    compiled object, and unlike the engine's own bounded cache, entries
+    are never evicted.
+
+    Raises:
+        re.error / regex.error: If the expression is invalid.
+    """
+    return _regex_engine.compile(regex, flags)
+
 
 class PatternLoader:
     """Singleton loader for patterns, vocabulary, and configuration.
@@ -47,13 +87,13 @@ class PatternLoader:
                 logger.error(error_msg)
                 raise ConfigurationError(error_msg)
 
-            with open(config_path, "r", encoding="utf-8") as f:
-                PatternLoader._config = yaml.safe_load(f)
+            PatternLoader._config = self._read_config(config_path)
 
             if not PatternLoader._config:
                 raise ConfigurationError("Configuration file is empty or invalid")
 
             self._validate_config()
+            self._compile_patterns()
 
             # Pre-compute stop words for fast access
             stop_list = PatternLoader._config.get("vocabulary", {}).get(
@@ -80,6 +120,58 @@ class PatternLoader:
             logger.error(f"Configuration loading failed: {e}", exc_info=True)
             raise ConfigurationError(f"Failed to load configuration: {e}") from e
 
+    @staticmethod
+    def _sidecar_path(config_path: Path) -> Path:
+        """Returns the location of the pickled copy of config_path."""
+        name = f"{config_path.name}.pkl"
+        cache_dir = os.environ.get(PATTERN_CACHE_DIR_ENV)
+        return Path(cache_dir) / name if cache_dir else config_path.with_name(name)
+
+    def _read_config(self, config_path: Path) -> Dict[str, Any]:
+        """Reads the configuration, preferring a current pickle sidecar.
+
+        The sidecar is keyed by the YAML file's mtime and size, so editing
+        patterns.yaml transparently invalidates it. Any problem reading or
+        writing the sidecar falls back to parsing the YAML.
+
+        Args:
+            config_path: Path to patterns.yaml
+
+        Returns:
+            Parsed configuration dictionary (may be empty or None)
+        """
+        stat = config_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        sidecar = self._sidecar_path(config_path)
+
+        try:
+            with open(sidecar, "rb") as f:
+                cached_key, cached_config = pickle.load(f)
+            if cached_key == key:
+                logger.debug(f"Loaded pre-parsed configuration from {sidecar}")
+                return cached_config
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable configuration cache {sidecar}: {e}")
+
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = yaml.load(f, Loader=_SafeLoader)
+
+        if config:
+            # Write to a temporary file first so concurrent workers never
+            # observe a partially written sidecar.
+            tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    pickle.dump((key, config), f, protocol=5)
+                os.replace(tmp_path, sidecar)
+            except OSError as e:
+                logger.debug(f"Could not write configuration cache {sidecar}: {e}")
+                tmp_path.unlink(missing_ok=True)
+
+        return config
+
     def _validate_config(self) -> None:
         """Validates required configuration sections exist.
 
@@ -94,6 +186,22 @@ class PatternLoader:
             logger.error(error_msg)
             raise ConfigurationError(error_msg)
 
+    def _compile_patterns(self) -> None:
+        """Pre-compiles every configured regex into a 'compiled' key.
+
+        Invalid expressions are logged and stored as None so that the
+        misconfiguration stays visible instead of failing at request time.
+        """
+        for entity_type, pattern_list in PatternLoader._config["patterns"].items():
+            for pattern in pattern_list or []:
+                try:
+                    pattern["compiled"] = _compile_once(pattern["regex"])
+                except _regex_engine.error as e:
+                    pattern["compiled"] = None
+                    logger.error(
+                        f"Invalid regex '{pattern.get('name')}' for {entity_type}: {e}"
+                    )
+
     @classmethod
     def get_instance(cls) -> "PatternLoader":
         """Returns the singleton instance of PatternLoader."""
@@ -108,7 +216,9 @@ class PatternLoader:
             entity_type: Entity type constant (e.g., EntityType.PATIENT_NAME)
 
         Returns:
-            List of pattern dictionaries with 'name', 'regex', 'score' keys
+            List of pattern dictionaries with 'name', 'regex', 'score' keys,
+            plus 'compiled' holding the pre-compiled regex (compiled with
+            REGEX_FLAGS, None if invalid). Prefer it over re-compiling 'regex'.
         """
         patterns = self._config.get("patterns", {}).get(entity_type, [])
         return patterns if patterns else []
@@ -2,12 +2,43 @@
 
 """Context-aware cache for patient names identified during redaction."""
 
+import bisect
+import importlib
 import logging
 import re
+import sys
+from contextlib import contextmanager
 from contextvars import ContextVar
-from typing import Set, Optional, Dict, Any, Pattern
+from types import ModuleType
+from typing import (
+    AbstractSet,
+    Set,
+    Optional,
+    Dict,
+    Any,
+    Pattern,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from redaction.core.loader import PatternLoader
 
+try:
+    # Optional accelerator: linear-time multi-pattern matching. Imported by
+    # name because the package ships no type information.
+    ahocorasick: Optional[ModuleType] = importlib.import_module("ahocorasick")
+except ImportError:
+    ahocorasick = None
+
+hyperscan: Optional[ModuleType]
+try:
+    # Optional accelerator: SIMD multi-literal scanning (Linux/x86 only)
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
 _patient_cache_var: ContextVar[Optional["PatientNameCache"]] = ContextVar(
@@ -15,6 +46,61 @@ _patient_cache_var: ContextVar[Optional["PatientNameCache"]] = ContextVar(
 )
 
 
+_EXTRA_CASES: Dict[int, Tuple[int, ...]]
+try:
+    # Characters re.IGNORECASE treats as equal beyond str.lower() (e.g. "i"
+    # and dotless "ı"); CPython keeps the table in a private module
+    _EXTRA_CASES = importlib.import_module("re._casefix")._EXTRA_CASES
+except (ImportError, AttributeError):
+    _EXTRA_CASES = {}
+
+# Maps each such character to one representative of its class, so folded
+# text and names compare equal wherever the regex would match them
+_CASE_CANON: Dict[int, int] = {
+    code: min(code, *extra)
+    for code, extra in _EXTRA_CASES.items()
+    if min(code, *extra) != code
+}
+
+
+def _fold(text_lower: str) -> str:
+    """Applies the regex case equivalences to already-lowercased text.
+
+    Length-preserving; ASCII text is returned unchanged.
+    """
+    return text_lower if text_lower.isascii() else text_lower.translate(_CASE_CANON)
+
+
+def _is_word_boundary(text: str, idx: int) -> bool:
+    """Mirrors the regex \\b assertion at position idx of text."""
+    before = idx > 0 and (text[idx - 1].isalnum() or text[idx - 1] == "_")
+    after = idx < len(text) and (text[idx].isalnum() or text[idx] == "_")
+    return before != after
+
+
+# Kinds of automaton keys; a single-word name can be both
+_PART = 1
+_FULL = 2
+
+
+def _neg_len(part: str) -> int:
+    """Sort key ordering name parts by descending length."""
+    return -len(part)
+
+
+_T = TypeVar("_T")
+
+
+def _thaw(values: AbstractSet[_T]) -> Set[_T]:
+    """Returns values as a mutable set, copying it only if frozen."""
+    return values if isinstance(values, set) else set(values)
+
+
+def _hyperscan_literal(part: str) -> bytes:
+    """Encodes part as a Hyperscan expression matching it literally."""
+    return b"".join(b"\\x%02x" % byte for byte in part.encode("utf-8"))
+
+
 class PatientNameCache:
     """Request-scoped storage for identified patient names.
 
@@ -25,11 +111,44 @@ class PatientNameCache:
 
     def __init__(self):
         """Initialize empty cache. Use get_instance() for context-safe access."""
-        self.full_names: Set[str] = set()
-        self.name_parts: Set[str] = set()
+        self.full_names: AbstractSet[str] = set()
+        self.name_parts: AbstractSet[str] = set()
         self.initialized: bool = False
 
+        # UTF-8 encodings of the above, for callers already holding bytes
+        self.full_names_bytes: AbstractSet[bytes] = set()
+        self.name_parts_bytes: AbstractSet[bytes] = set()
+
+        # Compiled matchers are memoized until a new name part is added; the
+        # dirty flags (rather than a None check) also memoize failed compiles.
         self._cached_regex: Optional[Pattern] = None
+        self._regex_dirty: bool = True
+
+        # Bytes-mode twin of the regex, used to scan ASCII text when every
+        # part is ASCII (byte offsets then equal character offsets).
+        self._cached_bytes_regex: Optional[Pattern] = None
+        self._bytes_regex_dirty: bool = True
+        self._all_parts_ascii: bool = True
+
+        # Name parts kept ordered by descending length as they are added, so
+        # rebuilding the regex alternation never has to re-sort the set.
+        self._sorted_parts: List[str] = []
+
+        # Full name patterns for the scan used without pyahocorasick. Kept on
+        # the request-scoped instance (not a process-wide cache) so patient
+        # names never outlive the request.
+        self._full_name_regexes: Dict[str, Pattern] = {}
+
+        # Aho-Corasick automaton over name parts and full names (pyahocorasick
+        # only), each key mapped to (length, kind bits). Words are added
+        # incrementally; _finalized tracks whether the automaton has been
+        # rebuilt since the last addition.
+        self._automaton = ahocorasick.Automaton() if ahocorasick else None
+        self._finalized: bool = False
+
+        # Hyperscan database over name parts, compiled lazily on first scan.
+        # False records a failed compile so it is not retried per document.
+        self._hs_db: Any = None
 
         loader = PatternLoader.get_instance()
         self.stop_words: Set[str] = loader.get_stop_words()
@@ -61,8 +180,17 @@ class PatientNameCache:
         if clean_name in self.stop_words:
             return
 
-        if clean_name not in self.full_names:
-            self.full_names.add(clean_name)
+        # Thaw sets frozen by freeze() if more names arrive afterwards
+        full_names = self.full_names = _thaw(self.full_names)
+        name_parts = self.name_parts = _thaw(self.name_parts)
+        full_names_bytes = self.full_names_bytes = _thaw(self.full_names_bytes)
+        name_parts_bytes = self.name_parts_bytes = _thaw(self.name_parts_bytes)
+
+        if clean_name not in full_names:
+            full_names.add(sys.intern(clean_name))
+            full_names_bytes.add(clean_name.encode("utf-8"))
+            if clean_name:
+                self._add_automaton_word(clean_name, _FULL)
 
         # Split into parts and store parts
         parts = clean_name.split()
@@ -71,31 +199,88 @@ class PatientNameCache:
         for part in parts:
             # Stricter filter: Part must be > 2 chars and not a stop word
             if len(part) > 2 and part not in self.stop_words:
-                if part not in self.name_parts:
-                    self.name_parts.add(part)
+                if part not in name_parts:
+                    part = sys.intern(part)
+                    name_parts.add(part)
+                    name_parts_bytes.add(part.encode("utf-8"))
+                    self._all_parts_ascii = self._all_parts_ascii and part.isascii()
+                    bisect.insort(self._sorted_parts, part, key=_neg_len)
                     added_new_part = True
+                    self._add_automaton_word(part, _PART)
 
         if added_new_part:
-            self._cached_regex = None
+            self._regex_dirty = True
+            self._bytes_regex_dirty = True
+            self._hs_db = None
 
         self.initialized = True
 
+    def _add_automaton_word(self, word: str, kind: int) -> None:
+        """Registers word in the shared automaton under the given kind."""
+        if self._automaton is None:
+            return
+        word = _fold(word)
+        _, existing = self._automaton.get(word, (0, 0))
+        self._automaton.add_word(word, (len(word), existing | kind))
+        self._finalized = False
+
+    def freeze(self) -> None:
+        """Freezes the cached names once Pass 1 has finished populating them.
+
+        Lookups against the frozensets are read-only for the rest of the
+        request; a later add_full_name() transparently thaws them. The
+        matcher match_names() will scan with is built here, so Pass 2 never
+        compiles it while scanning a document.
+        """
+        self.full_names = frozenset(self.full_names)
+        self.name_parts = frozenset(self.name_parts)
+        self.full_names_bytes = frozenset(self.full_names_bytes)
+        self.name_parts_bytes = frozenset(self.name_parts_bytes)
+        self._build_matchers()
+
+    def _build_matchers(self) -> None:
+        """Compiles the name matcher match_names() will scan with.
+
+        Follows match_names() precedence: the automaton serves full names and
+        parts whenever pyahocorasick is installed; otherwise parts go to
+        Hyperscan, or to the regexes without it. Matchers only needed for
+        unusual text (e.g. non-ASCII input) stay lazy.
+        """
+        if self._automaton is not None:
+            if len(self._automaton) and not self._finalized:
+                self._automaton.make_automaton()
+                self._finalized = True
+            return
+
+        if not self.name_parts:
+            return
+
+        if hyperscan is not None:
+            self._get_hyperscan_db()
+        else:
+            self.get_optimized_regex()
+            self.get_optimized_bytes_regex()
+
     def get_optimized_regex(self) -> Optional[Pattern]:
         """Returns a pre-compiled, optimized regex for all cached name parts.
 
-        Uses lazy instantiation (compile only on read) and memoization.
+        Compiled at most once per batch of new parts: the result (including a
+        failed compile) is memoized until add_full_name() adds a part.
         """
-        if self._cached_regex:
+        if not self._regex_dirty:
             return self._cached_regex
 
+        self._regex_dirty = False
+        self._cached_regex = None
+
         if not self.name_parts:
             return None
 
-        # Sort parts by length (descending) to match "Robert" before "Rob"
-        sorted_parts = sorted(self.name_parts, key=len, reverse=True)
-
+        # Parts are kept longest first to match "Robert" before "Rob"
         # Build optimized regex: \b(?:Part1|Part2|Part3)\b
-        pattern_str = r"\b(?:" + "|".join(re.escape(p) for p in sorted_parts) + r")\b"
+        pattern_str = (
+            r"\b(?:" + "|".join(re.escape(p) for p in self._sorted_parts) + r")\b"
+        )
 
         try:
             self._cached_regex = re.compile(pattern_str, re.IGNORECASE)
@@ -104,9 +289,203 @@ class PatientNameCache:
             logger.error(f"Failed to compile patient name regex: {e}")
             return None
 
-    def is_patient_name(self, text: str) -> bool:
-        """Checks if text matches known patient name or name part."""
-        text_lower = text.lower().strip()
+    def get_optimized_bytes_regex(self) -> Optional[Pattern]:
+        """Returns the name part regex compiled for bytes input.
+
+        Only available while every cached part is ASCII; bytes patterns fold
+        case for ASCII letters only. Memoized like get_optimized_regex().
+        """
+        if not self._bytes_regex_dirty:
+            return self._cached_bytes_regex
+
+        self._bytes_regex_dirty = False
+        self._cached_bytes_regex = None
+
+        if not self.name_parts or not self._all_parts_ascii:
+            return None
+
+        pattern_bytes = (
+            rb"\b(?:"
+            + b"|".join(re.escape(p.encode("ascii")) for p in self._sorted_parts)
+            + rb")\b"
+        )
+
+        try:
+            self._cached_bytes_regex = re.compile(pattern_bytes, re.IGNORECASE)
+            return self._cached_bytes_regex
+        except re.error as e:
+            logger.error(f"Failed to compile patient name bytes regex: {e}")
+            return None
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yields (start, end) spans of cached name parts found in text.
+
+        Spans are case-insensitive, whole-word and non-overlapping, matching
+        what get_optimized_regex().finditer(text) produces. Scans ASCII text
+        with Hyperscan when installed, otherwise uses a single Aho-Corasick
+        pass when pyahocorasick is installed, else the regex (in bytes mode
+        for ASCII text).
+        """
+        if not self.name_parts:
+            return
+
+        candidates: Optional[List[Tuple[int, int]]] = None
+
+        # Hyperscan reports UTF-8 byte offsets, which equal character
+        # offsets only for ASCII input.
+        if hyperscan is not None and text.isascii():
+            candidates = self._scan_hyperscan(text)
+
+        if candidates is None and self._automaton is not None:
+            text_lower = _fold(text.lower())
+            # str.lower() changes the length of a few code points, which
+            # would misalign offsets; those texts use the regex instead.
+            if len(text_lower) == len(text):
+                candidates = [
+                    (start, end)
+                    for start, end, kind in self._scan_automaton(text_lower)
+                    if kind & _PART
+                ]
+
+        if candidates is None:
+            if text.isascii():
+                bytes_pattern = self.get_optimized_bytes_regex()
+                if bytes_pattern:
+                    for bytes_match in bytes_pattern.finditer(text.encode("ascii")):
+                        yield bytes_match.span()
+                    return
+
+            pattern = self.get_optimized_regex()
+            if pattern:
+                for match in pattern.finditer(text):
+                    yield match.span()
+            return
+
+        yield from _select_parts(text, candidates)
+
+    def match_names(
+        self, text: str
+    ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """Finds cached full names and name parts in text.
+
+        Full name spans match re.finditer(re.escape(name), text, re.IGNORECASE)
+        for every cached full name (no word boundaries, non-overlapping per
+        name); part spans match iter_matches(). With pyahocorasick installed,
+        both come from one scan over the lowercased text.
+
+        Returns:
+            Tuple of (full name spans, name part spans), each sorted by start
+        """
+        if self._automaton is not None and self.full_names:
+            text_lower = _fold(text.lower())
+            if len(text_lower) == len(text):
+                occurrences = self._scan_automaton(text_lower)
+                full_spans = _select_full_names(
+                    text_lower,
+                    [(start, end) for start, end, kind in occurrences if kind & _FULL],
+                )
+                part_spans = list(
+                    _select_parts(
+                        text,
+                        [
+                            (start, end)
+                            for start, end, kind in occurrences
+                            if kind & _PART
+                        ],
+                    )
+                )
+                return full_spans, part_spans
+
+        full_spans = []
+        for full_name in self.full_names:
+            if not full_name:
+                continue
+            pattern = self._full_name_regexes.get(full_name)
+            if pattern is None:
+                pattern = re.compile(re.escape(full_name), re.IGNORECASE)
+                self._full_name_regexes[full_name] = pattern
+            for match in pattern.finditer(text):
+                full_spans.append(match.span())
+        full_spans.sort()
+
+        return full_spans, list(self.iter_matches(text))
+
+    def _scan_automaton(self, text_lower: str) -> List[Tuple[int, int, int]]:
+        """Returns every (start, end, kind) occurrence of a cached word."""
+        if not self._finalized:
+            self._automaton.make_automaton()
+            self._finalized = True
+
+        return [
+            (end_idx - length + 1, end_idx + 1, kind)
+            for end_idx, (length, kind) in self._automaton.iter(text_lower)
+        ]
+
+    def _scan_hyperscan(self, text: str) -> Optional[List[Tuple[int, int]]]:
+        """Returns every (start, end) occurrence of a name part.
+
+        Returns None if the Hyperscan database cannot be compiled.
+        """
+        db = self._get_hyperscan_db()
+        if db is None:
+            return None
+
+        spans: List[Tuple[int, int]] = []
+
+        def on_match(_id, start, end, _flags, _context):
+            spans.append((start, end))
+
+        db.scan(text.encode("ascii"), match_event_handler=on_match)
+        return spans
+
+    def _get_hyperscan_db(self) -> Any:
+        """Returns the Hyperscan database over name parts, or None on failure.
+
+        Memoized until a new part is added; False records a failed compile.
+        """
+        if hyperscan is None:
+            return None
+
+        if self._hs_db is None:
+            parts = self._sorted_parts
+            try:
+                flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST
+                db = hyperscan.Database()
+                db.compile(
+                    expressions=[_hyperscan_literal(_fold(p)) for p in parts],
+                    ids=list(range(len(parts))),
+                    flags=[flags] * len(parts),
+                )
+                self._hs_db = db
+            except hyperscan.error as e:
+                logger.error(f"Failed to compile patient name Hyperscan database: {e}")
+                self._hs_db = False
+
+        return None if self._hs_db is False else self._hs_db
+
+    def is_patient_name(self, text: Union[str, bytes]) -> bool:
+        """Checks if text matches known patient name or name part.
+
+        Accepts UTF-8 bytes as well as str; bytes are lowercased with ASCII
+        rules only and checked against the encoded name sets.
+        """
+        if not text:
+            return False
+
+        if isinstance(text, bytes):
+            text_lower_bytes = text.lower().strip()
+            if text_lower_bytes in self.full_names_bytes:
+                return True
+            return (
+                b" " not in text_lower_bytes
+                and text_lower_bytes in self.name_parts_bytes
+            )
+
+        text_lower = text.lower()
+
+        # Callers normally pass already-trimmed spans; only strip if needed.
+        if text_lower[0].isspace() or text_lower[-1].isspace():
+            text_lower = text_lower.strip()
 
         if text_lower in self.full_names:
             return True
@@ -131,10 +510,22 @@ class PatientNameCache:
 
     def reset(self) -> None:
         """Clears cache for current context."""
-        self.full_names.clear()
-        self.name_parts.clear()
+        self.full_names = set()
+        self.name_parts = set()
+        self.full_names_bytes = set()
+        self.name_parts_bytes = set()
         self.initialized = False
         self._cached_regex = None
+        self._regex_dirty = True
+        self._cached_bytes_regex = None
+        self._bytes_regex_dirty = True
+        self._all_parts_ascii = True
+        self._sorted_parts = []
+        self._full_name_regexes = {}
+        if self._automaton is not None:
+            self._automaton.clear()
+        self._finalized = False
+        self._hs_db = None
         logger.debug("PatientNameCache reset for current context")
 
     def __repr__(self):
@@ -144,3 +535,58 @@ class PatientNameCache:
             f"parts={len(self.name_parts)} "
             f"context_id={id(self)}>"
         )
+
+
+def _select_parts(
+    text: str, candidates: List[Tuple[int, int]]
+) -> Iterator[Tuple[int, int]]:
+    """Picks whole-word, leftmost-longest, non-overlapping part matches.
+
+    This is the same selection the regex alternation makes with parts
+    sorted by descending length.
+    """
+    candidates = [
+        (start, end)
+        for start, end in candidates
+        if _is_word_boundary(text, start) and _is_word_boundary(text, end)
+    ]
+    candidates.sort(key=lambda span: (span[0], -span[1]))
+    last_end = 0
+    for start, end in candidates:
+        if start >= last_end:
+            yield start, end
+            last_end = end
+
+
+def _select_full_names(
+    text_lower: str, candidates: List[Tuple[int, int]]
+) -> List[Tuple[int, int]]:
+    """Drops occurrences overlapping an earlier match of the same name.
+
+    Mirrors running re.finditer separately for each name: matches of one
+    name never overlap, while different names may.
+    """
+    candidates.sort()
+    last_end: Dict[str, int] = {}
+    spans = []
+    for start, end in candidates:
+        name = text_lower[start:end]
+        if start >= last_end.get(name, 0):
+            spans.append((start, end))
+            last_end[name] = end
+    return spans
+
+
+@contextmanager
+def patient_name_scope() -> Iterator[PatientNameCache]:
+    """Binds a fresh PatientNameCache to the current context for one document.
+
+    The previous binding is restored on exit, so sequential or nested
+    documents never see each other's names and no explicit reset is needed.
+    """
+    cache = PatientNameCache()
+    token = _patient_cache_var.set(cache)
+    try:
+        yield cache
+    finally:
+        _patient_cache_var.reset(token)
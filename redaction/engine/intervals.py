@@ -0,0 +1,66 @@
+# redaction/engine/intervals.py
+
+"""Sorted span index for overlap queries between recognizer results."""
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+# Below this many indexed spans, per-query bisect beats numpy's setup cost.
+VECTORIZE_MIN_SPANS = 50
+
+
+class SpanIndex:
+    """Read-only index over (start, end) character spans.
+
+    Spans are sorted by start and paired with a running maximum of their
+    ends, so an overlap query is a single binary search instead of a scan.
+    """
+
+    def __init__(self, spans: Iterable[Tuple[int, int]]):
+        ordered = sorted(spans)
+        self._starts: List[int] = [start for start, _ in ordered]
+        self._max_ends: List[int] = list(accumulate((end for _, end in ordered), max))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """Returns True if [start, end) overlaps any indexed span."""
+        # Spans starting before `end` form a prefix of the sorted list; one of
+        # them overlaps iff the furthest end within that prefix passes `start`.
+        i = bisect_left(self._starts, end)
+        return i > 0 and self._max_ends[i - 1] > start
+
+    def covers(self, start: int, end: int) -> bool:
+        """Returns True if some indexed span contains [start, end)."""
+        # Same prefix trick: among spans starting at or before `start`, the
+        # furthest end decides whether one of them reaches `end`.
+        i = bisect_right(self._starts, start)
+        return i > 0 and self._max_ends[i - 1] >= end
+
+    def overlaps_many(self, spans: Sequence[Tuple[int, int]]) -> List[bool]:
+        """Answers overlaps() for every span in one call.
+
+        Large indexes are queried with a single vectorized searchsorted;
+        small ones fall back to per-span bisect.
+
+        Args:
+            spans: (start, end) query spans
+
+        Returns:
+            One overlap flag per query span, in order
+        """
+        if not spans or len(self._starts) <= VECTORIZE_MIN_SPANS:
+            return [self.overlaps(start, end) for start, end in spans]
+
+        starts = np.asarray(self._starts, dtype=np.int64)
+        max_ends = np.asarray(self._max_ends, dtype=np.int64)
+        queries = np.asarray(spans, dtype=np.int64)
+
+        idx = np.searchsorted(starts, queries[:, 1], side="left")
+        has_prefix = idx > 0
+        prefix_max = max_ends[np.maximum(idx - 1, 0)]
+        return (has_prefix & (prefix_max > queries[:, 0])).tolist()
@@ -2,15 +2,33 @@
 
 """Presidio-based redaction engine with custom NLP and recognizers."""
 
+import copy
+import hashlib
 import logging
-from typing import List, Tuple
-from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
-from presidio_analyzer.nlp_engine import NerModelConfiguration
+import re
+import threading
+from collections import OrderedDict
+from typing import (
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from presidio_analyzer import AnalyzerEngine, RecognizerRegistry, RecognizerResult
+from presidio_analyzer.nlp_engine import NerModelConfiguration, NlpArtifacts
 from presidio_anonymizer import AnonymizerEngine
 from presidio_anonymizer.entities import OperatorConfig
 
-from redaction.engine.spacy_driver import CanadianClinicalNlpEngine
-from redaction.engine.cache import PatientNameCache
+from redaction.engine.spacy_driver import (
+    CanadianClinicalNlpEngine,
+    EXCLUDED_COMPONENTS,
+)
+from redaction.engine.cache import patient_name_scope
+from redaction.engine.intervals import SpanIndex
 from redaction.core.domain import RedactionResult, RedactedEntity
 from redaction.core.definitions import EntityType
 from redaction.core.exceptions import (
@@ -21,6 +39,99 @@ from redaction.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Gap between two same-type results that Presidio joins into one
+_SPACES_ONLY = re.compile(r"^( )+$")
+
+
+class _Span:
+    """Mutable result copy used by the in-house replacement path.
+
+    Equality and the overlap tests match presidio_anonymizer's
+    RecognizerResult, so the ported conflict handling below removes and
+    keeps exactly the same entries.
+    """
+
+    __slots__ = ("start", "end", "entity_type", "score")
+
+    def __init__(self, start: int, end: int, entity_type: str, score: float):
+        self.start = start
+        self.end = end
+        self.entity_type = entity_type
+        self.score = score
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, _Span)
+            and self.start == other.start
+            and self.end == other.end
+            and self.entity_type == other.entity_type
+            and self.score == other.score
+        )
+
+    def intersects(self, other: "_Span") -> int:
+        if self.end < other.start or other.end < self.start:
+            return 0
+        return min(self.end, other.end) - max(self.start, other.start)
+
+    def has_conflict(self, other: "_Span") -> bool:
+        if self.start == other.start and self.end == other.end:
+            return self.score <= other.score
+        return other.start <= self.start and other.end >= self.end
+
+
+def _remove_conflicts(spans: List[_Span]) -> List[_Span]:
+    """Port of AnonymizerEngine._remove_conflicts_and_get_text_manipulation_data.
+
+    Uses the default MERGE_SIMILAR_OR_CONTAINED strategy. Overlapping
+    results of the same type are merged into a later one, then results
+    contained in another (or equal to it with a lower or equal score) are
+    dropped, both in list order.
+    """
+    merged: List[_Span] = []
+    other_elements = spans.copy()
+    for result in spans:
+        other_elements.remove(result)
+
+        is_merge_same_entity_type = False
+        for other in other_elements:
+            if other.entity_type != result.entity_type:
+                continue
+            if result.intersects(other) == 0:
+                continue
+
+            other.start = min(result.start, other.start)
+            other.end = max(result.end, other.end)
+            other.score = max(result.score, other.score)
+            is_merge_same_entity_type = True
+            break
+        if not is_merge_same_entity_type:
+            other_elements.append(result)
+            merged.append(result)
+
+    unique: List[_Span] = []
+    other_elements = merged.copy()
+    for result in merged:
+        other_elements.remove(result)
+        if not any(result.has_conflict(other) for other in other_elements):
+            other_elements.append(result)
+            unique.append(result)
+
+    return unique
+
+
+def _merge_entities_with_spaces_between(text: str, spans: List[_Span]) -> List[_Span]:
+    """Port of AnonymizerEngine._merge_entities_with_spaces_between."""
+    merged: List[_Span] = []
+    prev: Optional[_Span] = None
+    for result in spans:
+        if prev is not None and prev.entity_type == result.entity_type:
+            if _SPACES_ONLY.search(text[prev.end : result.start]):
+                merged.remove(prev)
+                result.start = prev.start
+        merged.append(result)
+        prev = result
+    return merged
+
 
 class PresidioRedactionEngine:
     """Presidio-based engine with Canadian clinical NLP extensions.
@@ -29,18 +140,46 @@ class PresidioRedactionEngine:
     recognizers for Canadian healthcare PII/PHI.
     """
 
-    def __init__(self, spacy_model_name: str = "en_core_web_lg") -> None:
+    def __init__(
+        self,
+        spacy_model_name: str = "en_core_web_lg",
+        result_cache_size: int = 0,
+        batch_size: int = 64,
+        n_process: int = 1,
+        spacy_disable: Sequence[str] = (),
+    ) -> None:
         """Initialize redaction engine.
 
         Args:
             spacy_model_name: SpaCy model to use for NLP processing
+            result_cache_size: Number of recent documents whose NLP artifacts
+                and Pass 1 results are kept for reuse across requests (0, the
+                default, disables; cached entries hold PHI-derived data)
+            batch_size: Default number of documents spaCy parses per batch
+                in process_batch()
+            n_process: Default number of spaCy worker processes in
+                process_batch()
+            spacy_disable: Pipeline components loaded but disabled (e.g.
+                for an NER-only deployment)
 
         Raises:
             InitializationError: If model loading or engine setup fails.
         """
         self.spacy_model = spacy_model_name
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.spacy_disable = tuple(spacy_disable)
         self._analyzer: AnalyzerEngine
         self._anonymizer: AnonymizerEngine
+        self._operators_cache: Dict[FrozenSet[str], Dict[str, OperatorConfig]] = {}
+        self._replacements_cache: Dict[FrozenSet[str], Optional[Dict[str, str]]] = {}
+
+        self._result_cache_size = result_cache_size
+        self._result_cache: OrderedDict[
+            tuple, Tuple[NlpArtifacts, List[RecognizerResult]]
+        ] = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+
         self._initialize()
 
     def _initialize(self) -> None:
@@ -78,7 +217,14 @@ class PresidioRedactionEngine:
 
         nlp_config = {
             "nlp_engine_name": "spacy",
-            "models": [{"lang_code": "en", "model_name": self.spacy_model}],
+            "models": [
+                {
+                    "lang_code": "en",
+                    "model_name": self.spacy_model,
+                    "exclude": list(EXCLUDED_COMPONENTS),
+                    "disable": list(self.spacy_disable),
+                }
+            ],
         }
 
         logger.info(f"Initializing NLP engine with model: {self.spacy_model}")
@@ -107,6 +253,18 @@ class PresidioRedactionEngine:
             self._analyzer = AnalyzerEngine(registry=registry, nlp_engine=nlp_engine)
             self._anonymizer = AnonymizerEngine()
 
+            # Operators for spaCy NER labels, shared by every entity set.
+            # DEFAULT is pre-set so Presidio never adds it to a cached dict.
+            self._base_operators = {
+                "PERSON": OperatorConfig("replace", {"new_value": "<PERSON>"}),
+                "LOCATION": OperatorConfig("replace", {"new_value": "<LOCATION>"}),
+                "ORGANIZATION": OperatorConfig(
+                    "replace", {"new_value": "<ORGANIZATION>"}
+                ),
+                "DATE_TIME": OperatorConfig("replace", {"new_value": "<DATE>"}),
+                "DEFAULT": OperatorConfig("replace"),
+            }
+
             logger.info(
                 "Presidio engine initialized successfully",
                 extra={"recognizer_count": len(recognizers)},
@@ -116,160 +274,377 @@ class PresidioRedactionEngine:
             logger.error("Engine initialization failed", exc_info=True)
             raise InitializationError("Failed to initialize Presidio engine") from e
 
+    def _get_operators(self, entities: Collection[str]) -> Dict[str, OperatorConfig]:
+        """Returns anonymizer operators for an entity list, memoized per set.
+
+        Args:
+            entities: Entity types requested for redaction
+
+        Returns:
+            Mapping of entity type to replace-with-tag OperatorConfig
+        """
+        key = frozenset(entities)
+        operators = self._operators_cache.get(key)
+
+        if operators is None:
+            operators = {
+                entity_type: OperatorConfig(
+                    "replace", {"new_value": f"<{entity_type}>"}
+                )
+                for entity_type in entities
+            }
+            operators.update(self._base_operators)
+            self._operators_cache[key] = operators
+
+        return operators
+
+    def _get_replacements(self, entities: Collection[str]) -> Optional[Dict[str, str]]:
+        """Returns the tag each entity type is replaced with, memoized per set.
+
+        Args:
+            entities: Entity types requested for redaction
+
+        Returns:
+            Mapping of entity type to replacement string, or None when any
+            operator is not a plain replace and Presidio must anonymize
+        """
+        key = frozenset(entities)
+        if key in self._replacements_cache:
+            return self._replacements_cache[key]
+
+        replacements: Dict[str, str] = {}
+        for entity_type, operator in self._get_operators(entities).items():
+            if operator.operator_name != "replace":
+                self._replacements_cache[key] = None
+                return None
+            # Presidio's replace falls back to "<TYPE>" for an empty new_value
+            replacements[entity_type] = (operator.params or {}).get("new_value", "")
+
+        self._replacements_cache[key] = replacements
+        return replacements
+
+    @staticmethod
+    def _fast_replace(
+        text: str, results: List[RecognizerResult], replacements: Dict[str, str]
+    ) -> str:
+        """Replaces detected spans with their tags in a single pass.
+
+        Produces the same text as AnonymizerEngine.anonymize() with replace
+        operators: results are sorted by (start, end), conflicts are resolved
+        and space-separated neighbours joined by the ported Presidio routines
+        above, and replacements are applied from the end of the text as
+        Presidio's TextReplaceBuilder does, including on partial overlaps.
+
+        Args:
+            text: Original input text
+            results: Recognizer results to redact (not modified)
+            replacements: Replacement string per entity type, with a DEFAULT
+
+        Returns:
+            Redacted text
+        """
+        spans = [_Span(r.start, r.end, r.entity_type, r.score) for r in results]
+        spans.sort(key=lambda s: (s.start, s.end))
+        spans = _merge_entities_with_spaces_between(text, _remove_conflicts(spans))
+
+        default = replacements.get("DEFAULT", "")
+        # Pieces of the output from the end backwards. Each replacement is
+        # followed by the original text up to the previous replacement's
+        # start, clipped where they overlap.
+        pieces: List[str] = []
+        last = len(text)
+        for span in sorted(spans, key=lambda s: (s.start, s.end), reverse=True):
+            pieces.append(text[min(span.end, last) : last])
+            pieces.append(
+                replacements.get(span.entity_type, default) or f"<{span.entity_type}>"
+            )
+            last = span.start
+        pieces.append(text[:last])
+
+        return "".join(reversed(pieces))
+
+    def clear_result_cache(self) -> None:
+        """Drops every cached NLP artifact and Pass 1 result."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+
+    def _run_pass_1(
+        self,
+        text: str,
+        entities: Collection[str],
+        threshold: float,
+        nlp_artifacts: Optional[NlpArtifacts] = None,
+    ) -> Tuple[NlpArtifacts, List[RecognizerResult]]:
+        """Runs NLP and the Pass 1 recognizers, memoized per input.
+
+        Results are cached in a small LRU keyed by a digest of the text plus
+        the entity set and threshold. Cached results are copied on the way in
+        and out because older anonymizer releases merge overlapping results in
+        place.
+
+        Args:
+            text: Raw input text
+            entities: Entity types to detect
+            threshold: Confidence threshold for entity acceptance
+            nlp_artifacts: Pre-computed artifacts (e.g. from a batch), parsed
+                here when omitted
+
+        Returns:
+            Tuple of (NLP artifacts, Pass 1 recognizer results)
+        """
+        key = (
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+            frozenset(entities),
+            threshold,
+        )
+
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+
+        if cached is not None:
+            nlp_artifacts, results = cached
+            return nlp_artifacts, [copy.copy(r) for r in results]
+
+        # Parse text once (Request-Scoped NLP)
+        # We explicitly run NLP pipeline here and pass artifacts to recognizers
+        # to guarantee single-pass NLP processing.
+        if nlp_artifacts is None:
+            nlp_artifacts = self._analyzer.nlp_engine.process_text(text, language="en")
+
+        # 1. Pass 1: Run standard recognizers using pre-computed artifacts
+        # analyze() takes a list; callers may pass any collection (e.g. the
+        # frozenset snapshot of the default entities)
+        results = self._analyzer.analyze(
+            text=text,
+            entities=list(entities),
+            language="en",
+            score_threshold=threshold,
+            nlp_artifacts=nlp_artifacts,  # Pass artifacts to avoid re-parsing
+        )
+
+        if self._result_cache_size > 0:
+            with self._result_cache_lock:
+                self._result_cache[key] = (
+                    nlp_artifacts,
+                    [copy.copy(r) for r in results],
+                )
+                self._result_cache.move_to_end(key)
+                while len(self._result_cache) > self._result_cache_size:
+                    self._result_cache.popitem(last=False)
+
+        return nlp_artifacts, results
+
     def process(
-        self, text: str, entities: List[str], threshold: float
+        self, text: str, entities: Collection[str], threshold: float
     ) -> RedactionResult:
         """Analyzes and redacts input text using a Two-Pass architecture.
 
         Args:
             text: Raw input text to redact
-            entities: List of entity types to detect
+            entities: Entity types to detect (any collection; a set gives
+                O(1) membership tests)
             threshold: Confidence threshold for entity acceptance
 
         Returns:
             RedactionResult with redacted text and metadata
         """
-        # Lazy import to prevent circular dependency
-        from redaction.engine.recognizers import PatientNameRecognizer
-
         if not text:
             raise ValidationError("Input text cannot be empty")
 
         if not entities:
             raise ValidationError("Entity list cannot be empty")
 
-        try:
-            # 0. Safety: Reset the ContextVar cache
-            cache = PatientNameCache.get_instance()
-            cache.reset()
+        return self._process_document(text, entities, threshold)
 
-            # Parse text once (Request-Scoped NLP)
-            # We explicitly run NLP pipeline here and pass artifacts to recognizers
-            # to guarantee single-pass NLP processing.
-            nlp_artifacts = self._analyzer.nlp_engine.process_text(text, language="en")
+    def process_batch(
+        self,
+        texts: Iterable[str],
+        entities: Collection[str],
+        threshold: float,
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> List[RedactionResult]:
+        """Redacts several documents, running spaCy over them in batches.
 
-            # 1. Pass 1: Run standard recognizers using pre-computed artifacts
-            results_pass_1 = self._analyzer.analyze(
-                text=text,
-                entities=entities,
-                language="en",
-                score_threshold=threshold,
-                nlp_artifacts=nlp_artifacts,  # Pass artifacts to avoid re-parsing
-            )
+        The NLP pipeline runs once via nlp.pipe() for the whole batch, which
+        amortizes per-call overhead; each document then goes through its own
+        Pass 1, Pass 2 and anonymization exactly as in process().
 
-            # 2. Update Cache (Control Layer)
-            for result in results_pass_1:
-                if result.entity_type == EntityType.PATIENT_NAME:
-                    entity_text = text[result.start : result.end]
-                    cache.add_full_name(entity_text)
-
-            # 3. Pass 2: Ad-Hoc Recognition using populated Cache
-            results_pass_2 = []
-            if cache.initialized and EntityType.PATIENT_NAME in entities:
-                patient_recognizer = PatientNameRecognizer(cache=cache)
-                results_pass_2 = patient_recognizer.analyze(
-                    text=text,
-                    entities=[EntityType.PATIENT_NAME],
-                    nlp_artifacts=nlp_artifacts,  # Pass artifacts if needed for future logic
-                )
+        Args:
+            texts: Raw input texts to redact
+            entities: Entity types to detect
+            threshold: Confidence threshold for entity acceptance
+            batch_size: Number of documents spaCy processes per batch
+                (defaults to the engine's batch_size)
+            n_process: Number of spaCy worker processes (defaults to the
+                engine's n_process)
+
+        Returns:
+            RedactionResult per input text, in input order
+        """
+        texts = list(texts)
+
+        if any(not text for text in texts):
+            raise ValidationError("Input text cannot be empty")
 
-            combined_results = list(results_pass_1)
+        if not entities:
+            raise ValidationError("Entity list cannot be empty")
 
-            # Create list of exclusion intervals from Pass 1: [(start, end), ...]
-            # Sort by start position for potential binary search optimization,
-            # though linear scan over intervals is fast enough for typical doc sizes.
-            exclusion_zones: List[Tuple[int, int]] = sorted(
-                [(r.start, r.end) for r in results_pass_1], key=lambda x: x[0]
+        try:
+            artifacts = [
+                nlp_artifacts
+                for _, nlp_artifacts in self._analyzer.nlp_engine.process_batch(
+                    texts,
+                    language="en",
+                    batch_size=batch_size or self.batch_size,
+                    n_process=n_process or self.n_process,
+                )
+            ]
+        except Exception as e:
+            logger.error(
+                "Batch NLP processing failed",
+                exc_info=True,
+                extra={"batch_size": len(texts)},
             )
+            raise PipelineError(f"Failed to process redaction batch: {e}") from e
+
+        return [
+            self._process_document(text, entities, threshold, nlp_artifacts)
+            for text, nlp_artifacts in zip(texts, artifacts)
+        ]
+
+    def _process_document(
+        self,
+        text: str,
+        entities: Collection[str],
+        threshold: float,
+        nlp_artifacts: Optional[NlpArtifacts] = None,
+    ) -> RedactionResult:
+        """Runs both recognition passes and anonymization for one document.
 
-            for r in results_pass_2:
-                is_overlapping = False
-
-                # Check overlap against exclusion zones
-                # Interval A (r) overlaps Interval B (zone) if:
-                # r.start < zone.end AND r.end > zone.start
-                for zone_start, zone_end in exclusion_zones:
-                    if zone_start >= r.end:
-                        break
-
-                    if r.start < zone_end and r.end > zone_start:
-                        is_overlapping = True
-                        break
-
-                if not is_overlapping:
-                    combined_results.append(r)
-                    # Add new result to exclusion zones to prevent self-overlap in Pass 2
-                    # (Insert in order to maintain sort)
-                    # For simplicity in this implementation, we append and re-sort only if needed,
-                    # but typically Pass 2 results don't overlap *each other* due to regex logic.
-                    # We just rely on the initial Pass 1 exclusion zones for safety.
-                else:
-                    logger.debug(
-                        "Discarding Pass 2 result due to overlap",
-                        extra={"text": text[r.start : r.end], "type": r.entity_type},
-                    )
+        Args:
+            text: Raw input text to redact (already validated)
+            entities: Entity types to detect
+            threshold: Confidence threshold for entity acceptance
+            nlp_artifacts: Pre-computed NLP artifacts, parsed when omitted
 
-            # 5. Anonymize
-            operators = {
-                entity_type: OperatorConfig(
-                    "replace", {"new_value": f"<{entity_type}>"}
+        Returns:
+            RedactionResult with redacted text and metadata
+        """
+        # Lazy import to prevent circular dependency
+        from redaction.engine.recognizers import PatientNameRecognizer
+
+        try:
+            # 0. Safety: Bind a fresh ContextVar cache for this document
+            with patient_name_scope() as cache:
+                # Parse text once and run Pass 1 (reused for repeated submissions)
+                nlp_artifacts, results_pass_1 = self._run_pass_1(
+                    text, entities, threshold, nlp_artifacts
                 )
-                for entity_type in entities
-            }
 
-            operators.update(
-                {
-                    "PERSON": OperatorConfig("replace", {"new_value": "<PERSON>"}),
-                    "LOCATION": OperatorConfig("replace", {"new_value": "<LOCATION>"}),
-                    "ORGANIZATION": OperatorConfig(
-                        "replace", {"new_value": "<ORGANIZATION>"}
-                    ),
-                    "DATE_TIME": OperatorConfig("replace", {"new_value": "<DATE>"}),
-                }
-            )
+                # 2. Update Cache (Control Layer), collecting Pass 1 spans for
+                # the exclusion zones in the same pass over the results
+                pass_1_spans = []
+                for result in results_pass_1:
+                    pass_1_spans.append((result.start, result.end))
+                    if result.entity_type == EntityType.PATIENT_NAME:
+                        entity_text = text[result.start : result.end]
+                        cache.add_full_name(entity_text)
+
+                cache.freeze()
+
+                # 3. Pass 2: Ad-Hoc Recognition using populated Cache
+                # (skipped, along with its document scan, without name anchors)
+                results_pass_2 = []
+                if cache.full_names and EntityType.PATIENT_NAME in entities:
+                    patient_recognizer = PatientNameRecognizer(cache=cache)
+                    results_pass_2 = patient_recognizer.analyze(
+                        text=text,
+                        entities=[EntityType.PATIENT_NAME],
+                        nlp_artifacts=nlp_artifacts,  # Pass artifacts if needed for future logic
+                    )
 
-            anonymized = self._anonymizer.anonymize(
-                text=text,
-                analyzer_results=combined_results,
-                operators=operators,
-            )
+                combined_results = list(results_pass_1)
+
+                # Index Pass 1 spans as exclusion zones; each Pass 2 overlap check
+                # is then a binary search rather than a scan over every zone.
+                exclusion_zones = SpanIndex(pass_1_spans)
 
-            domain_entities = [
-                RedactedEntity(
-                    entity_type=r.entity_type,
-                    start=r.start,
-                    end=r.end,
-                    text=text[r.start : r.end],
-                    score=r.score,
-                    rule_name=(
-                        r.analysis_explanation.recognizer
-                        if r.analysis_explanation
-                        else "Unknown"
-                    ),
+                overlap_flags = exclusion_zones.overlaps_many(
+                    [(r.start, r.end) for r in results_pass_2]
                 )
-                for r in combined_results
-            ]
 
-            logger.info(
-                "Redaction completed",
-                extra={
-                    "entity_count": len(domain_entities),
-                    "text_length": len(text),
-                    "threshold": threshold,
-                    "cache_size": len(cache.full_names),
-                },
-            )
+                for r, is_overlapping in zip(results_pass_2, overlap_flags):
+                    if not is_overlapping:
+                        combined_results.append(r)
+                        # Pass 2 results are only checked against Pass 1 zones;
+                        # they typically don't overlap *each other* due to regex logic.
+                    elif logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Discarding Pass 2 result due to overlap",
+                            extra={
+                                "text": text[r.start : r.end],
+                                "type": r.entity_type,
+                            },
+                        )
+
+                # 5. Anonymize (skipped entirely when nothing was detected)
+                # Plain tag replacement is done in-house; Presidio is only
+                # needed when an operator does more than replace.
+                if not combined_results:
+                    redacted_text = text
+                elif (replacements := self._get_replacements(entities)) is not None:
+                    redacted_text = self._fast_replace(
+                        text, combined_results, replacements
+                    )
+                else:
+                    anonymized = self._anonymizer.anonymize(
+                        text=text,
+                        analyzer_results=combined_results,
+                        operators=self._get_operators(entities),
+                    )
+                    redacted_text = anonymized.text
+
+                domain_entities = [
+                    RedactedEntity(
+                        entity_type=r.entity_type,
+                        start=r.start,
+                        end=r.end,
+                        text=text[r.start : r.end],
+                        score=r.score,
+                        rule_name=(
+                            r.analysis_explanation.recognizer
+                            if r.analysis_explanation
+                            else "Unknown"
+                        ),
+                    )
+                    for r in combined_results
+                ]
+
+                logger.info(
+                    "Redaction completed",
+                    extra={
+                        "entity_count": len(domain_entities),
+                        "text_length": len(text),
+                        "threshold": threshold,
+                        "cache_size": len(cache.full_names),
+                    },
+                )
 
-            return RedactionResult(
-                original_text=text,
-                redacted_text=anonymized.text,
-                entities=domain_entities,
-                metadata={
-                    "count": len(combined_results),
-                    "engine": "CanadianClinicalNlpEngine",
-                    "entity_types": list(set(e.entity_type for e in domain_entities)),
-                },
-            )
+                return RedactionResult(
+                    original_text=text,
+                    redacted_text=redacted_text,
+                    entities=domain_entities,
+                    metadata={
+                        "count": len(combined_results),
+                        "engine": "CanadianClinicalNlpEngine",
+                        "entity_types": list(
+                            set(e.entity_type for e in domain_entities)
+                        ),
+                    },
+                )
 
         except (ValidationError, InitializationError):
             raise
@@ -2,9 +2,13 @@
 
 """Custom Presidio recognizers for Canadian healthcare PII/PHI."""
 
+import functools
 import logging
+import os
 import re
-from typing import List, Dict
+import threading
+from types import ModuleType
+from typing import Any, List, Optional, Set, Tuple
 from presidio_analyzer import (
     Pattern,
     PatternRecognizer,
@@ -15,35 +19,252 @@ from presidio_analyzer import (
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 from redaction.core.definitions import EntityType
-from redaction.core.loader import PatternLoader
+from redaction.core.loader import PatternLoader, REGEX_FLAGS
 from redaction.logic.validators import get_validator
 from redaction.engine.cache import PatientNameCache
+from redaction.engine.intervals import SpanIndex
+
+hyperscan: Optional[ModuleType]
+try:
+    # Optional accelerator: one SIMD prefilter scan for all bundled patterns
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    from presidio_analyzer.pattern_recognizer import REGEX_TIMEOUT_SECONDS
+except ImportError:
+    # Older presidio-analyzer releases lack the constant; use the same
+    # environment override and default as the releases that define it
+    REGEX_TIMEOUT_SECONDS = int(os.environ.get("REGEX_TIMEOUT_SECONDS", 60))
 
 logger = logging.getLogger(__name__)
 
-_PATTERN_CACHE: Dict[str, List[Pattern]] = {}
-
 
+@functools.lru_cache(maxsize=None)
 def _get_cached_patterns(entity_type: str) -> List[Pattern]:
     """Retrieves list of Pattern objects from cache or creates them."""
-    if entity_type in _PATTERN_CACHE:
-        return _PATTERN_CACHE[entity_type]
-
     loader = PatternLoader.get_instance()
     pattern_defs = loader.get_patterns(entity_type)
 
-    if not pattern_defs:
-        patterns = []
-    else:
-        patterns = [
-            Pattern(name=p["name"], regex=p["regex"], score=p["score"])
-            for p in pattern_defs
-        ]
+    patterns = []
+    for p in pattern_defs:
+        pattern = Pattern(name=p["name"], regex=p["regex"], score=p["score"])
+        # Hand over the loader's compiled regex; Presidio only recompiles
+        # when the flags differ from its own defaults. (Pattern initialises
+        # both attributes to None, which is all mypy infers for them.)
+        if p.get("compiled") is not None:
+            pattern.compiled_regex = p["compiled"]
+            pattern.compiled_with_flags = REGEX_FLAGS  # type: ignore[assignment]
+        patterns.append(pattern)
 
-    _PATTERN_CACHE[entity_type] = patterns
     return patterns
 
 
+def _compile_title_regex(titles: List[str]) -> Optional[re.Pattern]:
+    """Compiles one regex matching any healthcare title in a context window.
+
+    Titles ending in "." (e.g. "dr.") match anywhere; the rest must stand
+    as whole words. Titles are matched as given against lowercased context.
+
+    Returns:
+        Compiled pattern, or None if there are no titles
+    """
+    word_titles = [re.escape(t) for t in titles if not t.endswith(".")]
+    dot_titles = [re.escape(t) for t in titles if t.endswith(".")]
+
+    alternatives = []
+    if word_titles:
+        alternatives.append(r"\b(?:" + "|".join(word_titles) + r")\b")
+    if dot_titles:
+        alternatives.append("(?:" + "|".join(dot_titles) + ")")
+
+    if not alternatives:
+        return None
+    return re.compile("|".join(alternatives))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_title_regex() -> Optional[re.Pattern]:
+    """Returns the configured healthcare title regex, compiled once."""
+    loader = PatternLoader.get_instance()
+    return _compile_title_regex(loader.get_vocabulary("healthcare_titles"))
+
+
+class RegexBundleRecognizer(EntityRecognizer):
+    """Plain regex recognizer for several entity types behind one prefilter.
+
+    All patterns are compiled into a single Hyperscan database in prefilter
+    mode, which reports a superset of the patterns that can match. Each
+    document is scanned once and only the reported patterns are run with
+    their regular expressions, so results (spans, scores, explanations and
+    recognizer names) are the same as one PatternRecognizer per entity.
+
+    The database is shared, but Hyperscan scratch space is not thread-safe,
+    so each thread scans with its own clone of the database scratch.
+    """
+
+    def __init__(self, entities: List[str]):
+        # (entity, recognizer name, pattern, compiled regex)
+        self._patterns: List[Tuple[str, str, Pattern, Any]] = []
+        for entity in entities:
+            for pattern in _get_cached_patterns(entity):
+                compiled = pattern.compiled_regex
+                if compiled is None:
+                    # Invalid expression, already reported by the loader
+                    continue
+                self._patterns.append(
+                    (entity, f"Regex_{entity}_Recognizer", pattern, compiled)
+                )
+
+        super().__init__(
+            supported_entities=list(dict.fromkeys(e for e, *_ in self._patterns)),
+            name="RegexBundle_Recognizer",
+            supported_language="en",
+        )
+
+        self._db: Any = None
+        self._scratch = threading.local()
+        self._unfiltered: Set[int] = set()
+        self._compile_prefilter()
+
+    def load(self):
+        pass
+
+    def _compile_prefilter(self) -> None:
+        """Builds the Hyperscan database over every supported pattern.
+
+        Patterns Hyperscan cannot compile even as a prefilter are run on
+        every document instead.
+        """
+        assert hyperscan is not None
+        flags = (
+            hyperscan.HS_FLAG_PREFILTER
+            | hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_ALLOWEMPTY
+            | hyperscan.HS_FLAG_CASELESS
+            | hyperscan.HS_FLAG_DOTALL
+            | hyperscan.HS_FLAG_MULTILINE
+            | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_UCP
+        )
+
+        expressions, ids = [], []
+        for index, (_, _, pattern, _) in enumerate(self._patterns):
+            expression = pattern.regex.encode("utf-8")
+            try:
+                hyperscan.Database().compile(
+                    expressions=[expression], ids=[index], flags=[flags]
+                )
+            except hyperscan.error as e:
+                logger.debug("Pattern '%s' runs without prefilter: %s", pattern.name, e)
+                self._unfiltered.add(index)
+                continue
+            expressions.append(expression)
+            ids.append(index)
+
+        if not expressions:
+            return
+
+        try:
+            db = hyperscan.Database()
+            db.compile(expressions=expressions, ids=ids, flags=[flags] * len(ids))
+            self._db = db
+        except hyperscan.error as e:
+            logger.error("Failed to compile regex prefilter database: %s", e)
+            self._unfiltered.update(ids)
+
+    def _get_scratch(self) -> Any:
+        """Returns this thread's Hyperscan scratch, cloning it on first use."""
+        scratch = getattr(self._scratch, "scratch", None)
+        if scratch is None:
+            scratch = self._db.scratch.clone()
+            self._scratch.scratch = scratch
+        return scratch
+
+    def _candidate_patterns(self, text: str) -> Optional[Set[int]]:
+        """Returns indices of patterns that may match, or None for all.
+
+        Only ASCII text is prefiltered: Python's case-insensitive matching
+        folds some non-ASCII characters that Hyperscan does not.
+        """
+        if self._db is None or not text.isascii():
+            return None
+
+        candidates = set(self._unfiltered)
+
+        def on_match(pattern_id, _start, _end, _flags, _context):
+            candidates.add(pattern_id)
+
+        self._db.scan(
+            text.encode("ascii"),
+            match_event_handler=on_match,
+            scratch=self._get_scratch(),
+        )
+        return candidates
+
+    def analyze(
+        self,
+        text: str,
+        entities: List[str],
+        nlp_artifacts: Optional[NlpArtifacts] = None,
+    ) -> List[RecognizerResult]:
+        results: List[RecognizerResult] = []
+        candidates = self._candidate_patterns(text)
+
+        for index, (entity, recognizer_name, pattern, compiled) in enumerate(
+            self._patterns
+        ):
+            if entity not in entities:
+                continue
+            if candidates is not None and index not in candidates:
+                continue
+
+            # Same ReDoS guard as PatternRecognizer: a pattern that runs
+            # past the timeout is skipped for this document.
+            try:
+                for match in compiled.finditer(text, timeout=REGEX_TIMEOUT_SECONDS):
+                    start, end = match.span()
+                    if start == end:
+                        continue
+
+                    # No validation step, so validation_result stays unset
+                    # exactly as in PatternRecognizer.build_regex_explanation
+                    explanation = AnalysisExplanation(
+                        recognizer=recognizer_name,
+                        original_score=pattern.score,
+                        pattern_name=pattern.name,
+                        pattern=pattern.regex,
+                        regex_flags=REGEX_FLAGS,
+                        textual_explanation=(
+                            f"Detected by `{recognizer_name}` "
+                            f"using pattern `{pattern.name}`"
+                        ),
+                    )
+                    results.append(
+                        RecognizerResult(
+                            entity_type=entity,
+                            start=start,
+                            end=end,
+                            score=pattern.score,
+                            analysis_explanation=explanation,
+                            recognition_metadata={
+                                RecognizerResult.RECOGNIZER_NAME_KEY: recognizer_name,
+                                RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+                            },
+                        )
+                    )
+            except TimeoutError:
+                logger.warning(
+                    "Regex pattern '%s' timed out after %s seconds, skipping.",
+                    pattern.name,
+                    REGEX_TIMEOUT_SECONDS,
+                    exc_info=True,
+                )
+
+        return EntityRecognizer.remove_duplicates(results)
+
+
 class ProvincialHealthRecognizer(PatternRecognizer):
     """Pattern recognizer with provincial health number validation."""
 
@@ -51,7 +272,9 @@ class ProvincialHealthRecognizer(PatternRecognizer):
         loader = PatternLoader.get_instance()
         keywords = loader.get_province_keywords(province_code)
 
-        self.validator = get_validator(province_code, keywords)
+        self.validator = get_validator(
+            province_code, tuple(keywords) if keywords else None
+        )
         self.province_code = province_code
         patterns = _get_cached_patterns(entity_type)
 
@@ -68,8 +291,9 @@ class ProvincialHealthRecognizer(PatternRecognizer):
         result = self.validator.validate(pattern_text)
         if not result:
             logger.debug(
-                f"{self.province_code} validation failed for '{pattern_text}'. "
-                "Accepting based on format match."
+                "%s validation failed for '%s'. Accepting based on format match.",
+                self.province_code,
+                pattern_text,
             )
             return True
         return True
@@ -78,6 +302,10 @@ class ProvincialHealthRecognizer(PatternRecognizer):
 class CreditCardRecognizer(PatternRecognizer):
     """Credit card recognizer with prefix and length validation."""
 
+    # Spaces and hyphens are removed before the length and prefix checks;
+    # any other character (e.g. a tab separator) counts towards the length
+    SEPARATORS = str.maketrans("", "", " -")
+
     def __init__(self):
         loader = PatternLoader.get_instance()
         patterns = _get_cached_patterns(EntityType.CREDIT_CARD)
@@ -91,12 +319,8 @@ class CreditCardRecognizer(PatternRecognizer):
         )
 
     def validate_result(self, pattern_text: str) -> bool:
-        digits = pattern_text.replace("-", "").replace(" ", "")
-        if not (13 <= len(digits) <= 19):
-            return False
-        if digits[0] not in ["4", "5", "6", "3"]:
-            return False
-        return True
+        digits = pattern_text.translate(self.SEPARATORS)
+        return 13 <= len(digits) <= 19 and digits[0] in "3456"
 
 
 class PatientNamePatternRecognizer(PatternRecognizer):
@@ -120,6 +344,12 @@ class PatientRoleRecognizer(EntityRecognizer):
             name="PatientRoleRecognizer",
             supported_language="en",
         )
+        # Explanations are constant per recognizer, so results share one
+        self._role_explanation = AnalysisExplanation(
+            recognizer=self.name,
+            original_score=0.99,
+            textual_explanation="Derived from syntactic role (Dependency Parser)",
+        )
 
     def load(self):
         pass
@@ -132,26 +362,22 @@ class PatientRoleRecognizer(EntityRecognizer):
             return results
 
         doc = nlp_artifacts.tokens
+        person = doc.vocab.strings["PERSON"]
 
         for ent in doc.ents:
-            if ent.label_ != "PERSON":
+            if ent.label != person:
                 continue
             is_patient = any(
                 token._.has("role") and token._.role == "PATIENT" for token in ent
             )
             if is_patient:
-                score = 0.99
                 results.append(
                     RecognizerResult(
                         entity_type=EntityType.PATIENT_NAME,
                         start=ent.start_char,
                         end=ent.end_char,
-                        score=score,
-                        analysis_explanation=AnalysisExplanation(
-                            recognizer=self.name,
-                            original_score=score,
-                            textual_explanation="Derived from syntactic role (Dependency Parser)",
-                        ),
+                        score=self._role_explanation.original_score,
+                        analysis_explanation=self._role_explanation,
                     )
                 )
         return results
@@ -168,6 +394,18 @@ class PatientContextRecognizer(EntityRecognizer):
         )
         loader = PatternLoader.get_instance()
         self.patient_keywords = loader.get_vocabulary("patient_context_keywords")
+        # One alternation searched within each window replaces a substring
+        # test per keyword
+        self._keyword_re = (
+            re.compile("|".join(re.escape(k) for k in self.patient_keywords))
+            if self.patient_keywords
+            else None
+        )
+        self._context_explanation = AnalysisExplanation(
+            recognizer=self.name,
+            original_score=0.90,
+            textual_explanation="Identified via contextual keywords",
+        )
 
     def load(self):
         pass
@@ -179,10 +417,20 @@ class PatientContextRecognizer(EntityRecognizer):
         if not nlp_artifacts or not nlp_artifacts.tokens:
             return results
 
+        if self._keyword_re is None:
+            return results
+
         doc = nlp_artifacts.tokens
 
+        # Lowercase once; windows are then searched in place. If lowercasing
+        # changes the length, offsets would drift, so slice per entity.
+        text_lower = text.lower()
+        aligned = len(text_lower) == len(text)
+
+        person = doc.vocab.strings["PERSON"]
+
         for ent in doc.ents:
-            if ent.label_ != "PERSON":
+            if ent.label != person:
                 continue
             if any(
                 t._.has("is_healthcare_provider") and t._.is_healthcare_provider
@@ -191,21 +439,23 @@ class PatientContextRecognizer(EntityRecognizer):
                 continue
 
             context_start = max(0, ent.start_char - 30)
-            context = text[context_start : ent.start_char].lower()
+            if aligned:
+                found = self._keyword_re.search(
+                    text_lower, context_start, ent.start_char
+                )
+            else:
+                found = self._keyword_re.search(
+                    text[context_start : ent.start_char].lower()
+                )
 
-            if any(keyword in context for keyword in self.patient_keywords):
-                score = 0.90
+            if found:
                 results.append(
                     RecognizerResult(
                         entity_type=EntityType.PATIENT_NAME,
                         start=ent.start_char,
                         end=ent.end_char,
-                        score=score,
-                        analysis_explanation=AnalysisExplanation(
-                            recognizer=self.name,
-                            original_score=score,
-                            textual_explanation="Identified via contextual keywords",
-                        ),
+                        score=self._context_explanation.original_score,
+                        analysis_explanation=self._context_explanation,
                     )
                 )
         return results
@@ -226,7 +476,18 @@ class PatientNameRecognizer(EntityRecognizer):
             supported_language="en",
         )
         self.cache = cache
-        self.loader = PatternLoader.get_instance()
+        # Built once per process: a recognizer is created for every document
+        self._title_re = _get_title_regex()
+        self._full_name_explanation = AnalysisExplanation(
+            recognizer=self.name,
+            original_score=0.95,
+            textual_explanation="Matched to identified patient full name",
+        )
+        self._name_part_explanation = AnalysisExplanation(
+            recognizer=self.name,
+            original_score=0.85,
+            textual_explanation="Matched to identified patient name part",
+        )
 
     def load(self):
         pass
@@ -239,71 +500,46 @@ class PatientNameRecognizer(EntityRecognizer):
         if not self.cache.initialized:
             return results
 
-        healthcare_titles = self.loader.get_vocabulary("healthcare_titles")
+        # Full names and name parts come from a single scan of the text
+        full_spans, part_spans = self.cache.match_names(text)
 
         # 1. Match Full Names (High Confidence)
-        for full_name in self.cache.full_names:
-            if not full_name:
-                continue
-            pattern = re.escape(full_name)
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                score = 0.95
-                results.append(
-                    RecognizerResult(
-                        entity_type=EntityType.PATIENT_NAME,
-                        start=match.start(),
-                        end=match.end(),
-                        score=score,
-                        analysis_explanation=AnalysisExplanation(
-                            recognizer=self.name,
-                            original_score=score,
-                            textual_explanation="Matched to identified patient full name",
-                        ),
-                    )
+        full_name_score = self._full_name_explanation.original_score
+        for start, end in full_spans:
+            results.append(
+                RecognizerResult(
+                    entity_type=EntityType.PATIENT_NAME,
+                    start=start,
+                    end=end,
+                    score=full_name_score,
+                    analysis_explanation=self._full_name_explanation,
                 )
+            )
 
         # 2. Match Name Parts (One-Pass)
-        pattern = self.cache.get_optimized_regex()
+        full_name_index = SpanIndex(full_spans)
+        part_score = self._name_part_explanation.original_score
 
-        if not pattern:
-            return results
-
-        for match in pattern.finditer(text):
-            idx = match.start()
-            end_idx = match.end()
+        for idx, end_idx in part_spans:
 
             # Deduplicate: Don't add if covered by Full Name match
-            if any(r.start <= idx and r.end >= end_idx for r in results):
+            if full_name_index.covers(idx, end_idx):
                 continue
 
             # Context check: Exclude doctor names
             context_start = max(0, idx - 15)
             context = text[context_start:idx].lower()
 
-            is_provider = False
-            for title in healthcare_titles:
-                if re.search(r"\b" + re.escape(title) + r"\b", context):
-                    is_provider = True
-                    break
-                if title.endswith(".") and title in context:
-                    is_provider = True
-                    break
-
-            if is_provider:
+            if self._title_re is not None and self._title_re.search(context):
                 continue
 
-            score = 0.85
             results.append(
                 RecognizerResult(
                     entity_type=EntityType.PATIENT_NAME,
                     start=idx,
                     end=end_idx,
-                    score=score,
-                    analysis_explanation=AnalysisExplanation(
-                        recognizer=self.name,
-                        original_score=score,
-                        textual_explanation="Matched to identified patient name part",
-                    ),
+                    score=part_score,
+                    analysis_explanation=self._name_part_explanation,
                 )
             )
 
@@ -312,7 +548,7 @@ class PatientNameRecognizer(EntityRecognizer):
 
 def create_all_recognizers() -> List[EntityRecognizer]:
     """Create the standard set of recognizers used in the first pass."""
-    recognizers = []
+    recognizers: List[EntityRecognizer] = []
     loader = PatternLoader.get_instance()
 
     # Provincial Health Recognizers
@@ -335,7 +571,7 @@ def create_all_recognizers() -> List[EntityRecognizer]:
     for code, entity in mapping:
         if not loader.get_patterns(entity):
             logger.warning(
-                f"Skipping {code} Health Recognizer: No patterns found for {entity}"
+                "Skipping %s Health Recognizer: No patterns found for %s", code, entity
             )
             continue
         recognizers.append(ProvincialHealthRecognizer(code, entity))
@@ -355,19 +591,24 @@ def create_all_recognizers() -> List[EntityRecognizer]:
     ]
 
     for entity in other_entities:
-        patterns = _get_cached_patterns(entity)
-        if patterns:
+        if not _get_cached_patterns(entity):
+            logger.warning(
+                "Skipping Regex Recognizer for %s: No patterns found.", entity
+            )
+    other_entities = [e for e in other_entities if _get_cached_patterns(e)]
+
+    if hyperscan is not None and other_entities:
+        # One prefiltered scan per document instead of one pass per entity
+        recognizers.append(RegexBundleRecognizer(other_entities))
+    else:
+        for entity in other_entities:
             recognizers.append(
                 PatternRecognizer(
                     supported_entity=entity,
                     name=f"Regex_{entity}_Recognizer",
-                    patterns=patterns,
+                    patterns=_get_cached_patterns(entity),
                 )
             )
-        else:
-            logger.warning(
-                f"Skipping Regex Recognizer for {entity}: No patterns found."
-            )
 
     # Credit Card
     if loader.get_patterns(EntityType.CREDIT_CARD):
@@ -384,5 +625,5 @@ def create_all_recognizers() -> List[EntityRecognizer]:
     recognizers.append(PatientContextRecognizer())
     recognizers.append(PatientRoleRecognizer())
 
-    logger.info(f"Initialized {len(recognizers)} recognizers (Pass 1 set)")
+    logger.info("Initialized %d recognizers (Pass 1 set)", len(recognizers))
     return recognizers
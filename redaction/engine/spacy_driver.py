@@ -3,88 +3,50 @@
 """Custom SpaCy NLP engine with clinical dependency parsing."""
 
 import logging
+from typing import Any, Dict, Set, Tuple, cast
+
+import numpy as np
 import spacy
+from spacy.attrs import ENT_IOB, ENT_TYPE, LOWER
 from spacy.matcher import DependencyMatcher
 from spacy.language import Language
-from spacy.tokens import Token
+from spacy.tokens import Doc, Token
 from presidio_analyzer.nlp_engine import SpacyNlpEngine
 
 from redaction.core.loader import PatternLoader
 
 logger = logging.getLogger(__name__)
 
+# Pipeline components no recognizer reads. 'textcat' (classification) and
+# 'senter' (sentence tokenizer) are dropped as 'parser' handles sentence
+# boundaries sufficiently for this use case. 'attribute_ruler' and
+# 'lemmatizer' must stay: the role matcher's LEMMA patterns depend on them.
+EXCLUDED_COMPONENTS = ("textcat", "senter")
 
-class CanadianClinicalNlpEngine(SpacyNlpEngine):
-    """SpaCy NLP engine extended with clinical dependency parsing."""
-
-    def __init__(self, models_config):
-        models = (
-            models_config.get("models")
-            if isinstance(models_config, dict)
-            else models_config
-        )
-
-        if not models:
-            # Disable 'textcat' (classification) and 'senter' (sentence tokenizer)
-            # as 'parser' handles sentence boundaries sufficiently for this use case.
-            models = [
-                {
-                    "lang_code": "en",
-                    "model_name": "en_core_web_lg",
-                    "exclude": ["textcat", "senter"],
-                }
-            ]
-
-        logger.info(f"Initializing SpacyNlpEngine with models: {models}")
-
-        super().__init__(models=models)
-
-        # Ensure the model is loaded
-        if not self.nlp or "en" not in self.nlp:
-            logger.warning("Model 'en' not loaded by parent. Attempting manual load.")
-            try:
-                model_conf = models[0]
-                model_name = model_conf["model_name"]
-                exclude = model_conf.get("exclude", [])
-
-                self.nlp = {"en": spacy.load(model_name, exclude=exclude)}
-                logger.info(f"Loaded spaCy model '{model_name}' excluding {exclude}")
-            except Exception as e:
-                logger.error(f"Failed to load spaCy model: {e}")
-                raise ValueError(f"Could not load spaCy model '{model_name}'")
-
-        nlp = self.nlp["en"]
+# Components the role extractor and recognizers read from: NER labels, the
+# dependency parse, and the LEMMA/POS attributes used by the role matcher.
+REQUIRED_COMPONENTS = ("ner", "parser", "tagger", "attribute_ruler", "lemmatizer")
 
-        # Register custom extensions
-        if not Token.has_extension("role"):
-            Token.set_extension("role", default=None)
 
-        if not Token.has_extension("is_healthcare_provider"):
-            Token.set_extension("is_healthcare_provider", default=False)
+class ClinicalRoleExtractor:
+    """SpaCy pipeline component for clinical role extraction.
 
-        # Add component to pipeline
-        if "role_extractor" not in nlp.pipe_names:
-            nlp.add_pipe("role_extractor", last=True)
-            logger.info("Added 'role_extractor' to spaCy pipeline")
+    Vocabulary and the DependencyMatcher are built once when the component
+    is added to a pipeline; each call only matches and tags the Doc.
+    """
 
-    @staticmethod
-    @Language.component("role_extractor")
-    def role_extractor_component(doc):
-        """SpaCy pipeline component for clinical role extraction."""
+    def __init__(self, nlp: Language, name: str = "role_extractor"):
         loader = PatternLoader.get_instance()
 
-        # 1. Identify Healthcare Providers
-        healthcare_titles = set(loader.get_vocabulary("healthcare_titles"))
+        self.name = name
+        self.healthcare_titles = frozenset(loader.get_vocabulary("healthcare_titles"))
 
-        for ent in doc.ents:
-            if ent.label_ == "PERSON" and ent.start > 0:
-                prev_token = doc[ent.start - 1]
-                if prev_token.text.lower() in healthcare_titles:
-                    for token in ent:
-                        token._.is_healthcare_provider = True
-
-        # 2. Dependency Matching for Patient Role
-        matcher = DependencyMatcher(doc.vocab)
+        # String-store hashes, so labels and titles compare as integers
+        self._person_hash = nlp.vocab.strings.add("PERSON")
+        self._title_hashes = np.array(
+            [nlp.vocab.strings.add(t) for t in sorted(self.healthcare_titles)],
+            dtype=np.uint64,
+        )
 
         verbs_active = loader.get_vocabulary("patient_verbs_active")
         verbs_passive = loader.get_vocabulary("patient_verbs_passive")
@@ -115,8 +77,24 @@ class CanadianClinicalNlpEngine(SpacyNlpEngine):
             },
         ]
 
-        matcher.add("PATIENT_ROLE", [patient_active_pattern, patient_passive_pattern])
-        matches = matcher(doc)
+        self.matcher = DependencyMatcher(nlp.vocab)
+        self.matcher.add(
+            "PATIENT_ROLE", [patient_active_pattern, patient_passive_pattern]
+        )
+
+    def __call__(self, doc: Doc) -> Doc:
+        # 1. Identify Healthcare Providers: PERSON entities whose previous
+        # token is a title, found from token attribute arrays so that Python
+        # only touches the matching entities.
+        provider_starts = self._provider_entity_starts(doc)
+        if provider_starts:
+            for ent in doc.ents:
+                if ent.start in provider_starts:
+                    for token in ent:
+                        token._.is_healthcare_provider = True
+
+        # 2. Dependency Matching for Patient Role
+        matches = self.matcher(doc)
 
         # 3. Tag Patient Names
         for _, token_ids in matches:
@@ -127,7 +105,7 @@ class CanadianClinicalNlpEngine(SpacyNlpEngine):
 
             subject_token._.role = "PATIENT"
 
-            if subject_token.ent_type_ == "PERSON":
+            if subject_token.ent_type == self._person_hash:
                 for ent in doc.ents:
                     if subject_token.i >= ent.start and subject_token.i < ent.end:
                         if not any(t._.is_healthcare_provider for t in ent):
@@ -136,3 +114,121 @@ class CanadianClinicalNlpEngine(SpacyNlpEngine):
                         break
 
         return doc
+
+    def _provider_entity_starts(self, doc: Doc) -> Set[int]:
+        """Returns start indices of PERSON entities preceded by a title."""
+        if len(doc) < 2 or not len(self._title_hashes):
+            return set()
+
+        attrs = doc.to_array([ENT_IOB, ENT_TYPE, LOWER])
+
+        # ENT_IOB 3 marks the first token of an entity
+        is_person_start = (attrs[1:, 0] == 3) & (attrs[1:, 1] == self._person_hash)
+        follows_title = np.isin(attrs[:-1, 2], self._title_hashes)
+
+        return set((np.flatnonzero(is_person_start & follows_title) + 1).tolist())
+
+
+def _register_extensions() -> None:
+    """Registers the Token extensions written by the role extractor."""
+    if not Token.has_extension("role"):
+        Token.set_extension("role", default=None)
+
+    if not Token.has_extension("is_healthcare_provider"):
+        Token.set_extension("is_healthcare_provider", default=False)
+
+
+@Language.factory("role_extractor")
+def create_role_extractor(nlp: Language, name: str) -> ClinicalRoleExtractor:
+    """Creates the role_extractor pipeline component."""
+    return ClinicalRoleExtractor(nlp, name)
+
+
+class CanadianClinicalNlpEngine(SpacyNlpEngine):
+    """SpaCy NLP engine extended with clinical dependency parsing."""
+
+    def __init__(self, models_config):
+        models = (
+            models_config.get("models")
+            if isinstance(models_config, dict)
+            else models_config
+        )
+
+        if not models:
+            models = [
+                {
+                    "lang_code": "en",
+                    "model_name": "en_core_web_lg",
+                    "exclude": list(EXCLUDED_COMPONENTS),
+                }
+            ]
+
+        logger.info("Initializing SpacyNlpEngine with models: %s", models)
+
+        super().__init__(models=models)
+
+        # Ensure the model is loaded
+        if not self.nlp or "en" not in self.nlp:
+            logger.warning("Model 'en' not loaded by parent. Attempting manual load.")
+            try:
+                model_conf = models[0]
+                model_name = model_conf["model_name"]
+                exclude = model_conf.get("exclude", [])
+                disable = model_conf.get("disable", [])
+
+                required = [c for c in disable if c in REQUIRED_COMPONENTS]
+                if required:
+                    logger.warning(
+                        "Disabling %s weakens patient role detection", required
+                    )
+
+                self.nlp = {
+                    "en": spacy.load(model_name, exclude=exclude, disable=disable)
+                }
+                logger.info(
+                    "Loaded spaCy model '%s' excluding %s, disabling %s",
+                    model_name,
+                    exclude,
+                    disable,
+                )
+            except Exception as e:
+                logger.error("Failed to load spaCy model: %s", e)
+                raise ValueError(f"Could not load spaCy model '{model_name}'")
+
+        nlp = self.nlp["en"]
+
+        _register_extensions()
+
+        # Add component to pipeline
+        if "role_extractor" not in nlp.pipe_names:
+            nlp.add_pipe("role_extractor", last=True)
+            logger.info("Added 'role_extractor' to spaCy pipeline")
+
+    def serialize(self) -> Tuple[Dict[str, Any], bytes]:
+        """Serializes the loaded pipeline, role_extractor included.
+
+        Lets worker processes rebuild the pipeline with load_serialized()
+        instead of resolving and loading the model package again.
+
+        Returns:
+            Tuple of (pipeline config, pipeline bytes from Language.to_bytes())
+        """
+        # Presidio leaves self.nlp untyped (None until load() runs)
+        nlp = cast(Dict[str, Language], self.nlp)["en"]
+        return nlp.config, nlp.to_bytes()
+
+    @staticmethod
+    def load_serialized(config: Dict[str, Any], data: bytes) -> Language:
+        """Rebuilds a pipeline produced by serialize().
+
+        Args:
+            config: Pipeline config returned by serialize()
+            data: Pipeline bytes returned by serialize()
+
+        Returns:
+            The restored spaCy Language with custom extensions registered
+        """
+        _register_extensions()
+        lang_cls = spacy.util.get_lang_class(config["nlp"]["lang"])
+        nlp = lang_cls.from_config(config)
+        return nlp.from_bytes(data)
@@ -6,7 +6,15 @@ import logging
 import sys
 import json
 from datetime import datetime, timezone
-from typing import Any, Dict
+from types import ModuleType
+from typing import Any, Dict, MutableMapping, Optional, Tuple
+
+orjson: Optional[ModuleType]
+try:
+    # Optional accelerator: C JSON encoder
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class StructuredFormatter(logging.Formatter):
@@ -21,7 +29,8 @@ class StructuredFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string
         """
-        current_time = datetime.now(timezone.utc).isoformat()
+        # record.created was already sampled by the logging framework
+        current_time = datetime.fromtimestamp(record.created, timezone.utc).isoformat()
 
         log_data: Dict[str, Any] = {
             "timestamp": current_time,
@@ -39,9 +48,42 @@ class StructuredFormatter(logging.Formatter):
         if hasattr(record, "extra"):
             log_data.update(record.extra)  # type: ignore
 
+        if orjson is not None:
+            try:
+                return orjson.dumps(log_data).decode("utf-8")
+            except TypeError:
+                # Values orjson rejects (e.g. non-str keys) go through json
+                pass
+
         return json.dumps(log_data)
 
 
+class ContextLoggerAdapter(logging.LoggerAdapter):
+    """Logger adapter that binds static context to every record.
+
+    Unlike the stdlib adapter before Python 3.13 (which replaces a call's
+    extra with the bound context), per-call extra fields are merged on top
+    of the bound ones, so callers pass only the fields that vary.
+    """
+
+    def process(
+        self, msg: Any, kwargs: MutableMapping[str, Any]
+    ) -> Tuple[Any, MutableMapping[str, Any]]:
+        """Merges the bound context into the call's extra.
+
+        Args:
+            msg: Log message
+            kwargs: Keyword arguments of the logging call
+
+        Returns:
+            Tuple of (message, keyword arguments with merged extra)
+        """
+        extra = kwargs.get("extra")
+        bound = self.extra or {}
+        kwargs["extra"] = {**bound, **extra} if extra else bound
+        return msg, kwargs
+
+
 def configure_logging(level: str = "INFO") -> None:
     """Configure application logging.
 
@@ -2,14 +2,28 @@
 
 """Validation strategies for Canadian provincial health numbers."""
 
+import functools
 import re
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+class _DigitsOnlyTable(dict):
+    """str.translate table deleting every code point except ASCII digits.
+
+    Entries are filled in on first sight, so repeated characters are
+    resolved by a plain dict lookup inside translate().
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = codepoint if 48 <= codepoint <= 57 else None
+        self[codepoint] = value
+        return value
+
+
 class ValidationLogic:
     """Utility methods for validation algorithms."""
 
@@ -17,32 +31,63 @@ class ValidationLogic:
     NON_DIGIT = re.compile(r"[^0-9]")
     NON_ALPHANUM = re.compile(r"[^A-Z0-9]")
 
+    # Luhn contribution of each ASCII digit byte, undoubled and doubled
+    LUHN_PLAIN = bytes(i - 48 if 48 <= i <= 57 else 0 for i in range(256))
+    LUHN_DOUBLED = bytes(
+        (2 * (i - 48) - 9 if i >= 53 else 2 * (i - 48)) if 48 <= i <= 57 else 0
+        for i in range(256)
+    )
+
     @staticmethod
     def luhn_check(digits: str) -> bool:
         """Performs Modulus 10 (Luhn) checksum validation.
 
+        Digits are mapped to their Luhn contributions with two bytes.translate
+        lookups (every second digit from the right is doubled), so the sum
+        runs without a per-digit Python loop.
+
         Args:
             digits: Numeric string to validate
 
         Returns:
             True if checksum is valid
         """
-        if not digits.isdigit():
+        if not (digits.isascii() and digits.isdigit()):
             return False
 
-        total = 0
-        reverse_digits = digits[::-1]
-
-        for i, digit in enumerate(reverse_digits):
-            n = int(digit)
-            if i % 2 == 1:
-                n *= 2
-                if n > 9:
-                    n -= 9
-            total += n
+        b = digits.encode("ascii")
+        total = sum(b[-1::-2].translate(ValidationLogic.LUHN_PLAIN)) + sum(
+            b[-2::-2].translate(ValidationLogic.LUHN_DOUBLED)
+        )
 
         return total % 10 == 0
 
+    @staticmethod
+    def strip_non_digits(text: str) -> str:
+        """Removes every character that is not an ASCII digit.
+
+        Args:
+            text: Input string
+
+        Returns:
+            The ASCII digits of text, in order
+        """
+        return text.translate(_DIGITS_ONLY)
+
+    @staticmethod
+    def luhn_of_length(text: str, length: int) -> bool:
+        """Checks that text holds exactly length digits passing Luhn.
+
+        Args:
+            text: Candidate number, possibly with separators
+            length: Required number of digits
+
+        Returns:
+            True if the digit count matches and the checksum is valid
+        """
+        digits = text.translate(_DIGITS_ONLY)
+        return len(digits) == length and ValidationLogic.luhn_check(digits)
+
     @staticmethod
     def sanitize(text: str) -> str:
         """Removes non-alphanumeric characters and converts to uppercase.
@@ -56,6 +101,9 @@ class ValidationLogic:
         return ValidationLogic.NON_ALPHANUM.sub("", text.upper())
 
 
+_DIGITS_ONLY = _DigitsOnlyTable()
+
+
 class ValidatorStrategy(ABC):
     """Base class for province-specific validation strategies."""
 
@@ -83,20 +131,14 @@ class OntarioValidator(ValidatorStrategy):
     """Validator for Ontario Health Card Numbers (OHIP)."""
 
     def validate(self, text: str) -> bool:
-        digits = ValidationLogic.NON_DIGIT.sub("", text)
-        if len(digits) != 10:
-            return False
-        return ValidationLogic.luhn_check(digits)
+        return ValidationLogic.luhn_of_length(text, 10)
 
 
 class BCValidator(ValidatorStrategy):
     """Validator for British Columbia Personal Health Numbers."""
 
     def validate(self, text: str) -> bool:
-        digits = ValidationLogic.NON_DIGIT.sub("", text)
-        if len(digits) != 10:
-            return False
-        return ValidationLogic.luhn_check(digits)
+        return ValidationLogic.luhn_of_length(text, 10)
 
 
 class QuebecValidator(ValidatorStrategy):
@@ -139,20 +181,14 @@ class AlbertaValidator(ValidatorStrategy):
     """Validator for Alberta Personal Health Numbers."""
 
     def validate(self, text: str) -> bool:
-        digits = ValidationLogic.NON_DIGIT.sub("", text)
-        if len(digits) != 9:
-            return False
-        return ValidationLogic.luhn_check(digits)
+        return ValidationLogic.luhn_of_length(text, 9)
 
 
 class SaskatchewanValidator(ValidatorStrategy):
     """Validator for Saskatchewan Health Services Numbers."""
 
     def validate(self, text: str) -> bool:
-        digits = ValidationLogic.NON_DIGIT.sub("", text)
-        if len(digits) != 9:
-            return False
-        return ValidationLogic.luhn_check(digits)
+        return ValidationLogic.luhn_of_length(text, 9)
 
 
 class ManitobaValidator(ValidatorStrategy):
@@ -166,49 +202,35 @@ class ManitobaValidator(ValidatorStrategy):
         if self.FAMILY_REG_PATTERN.match(s):
             return True
 
-        digits = ValidationLogic.NON_DIGIT.sub("", text)
-        if len(digits) == 9:
-            return ValidationLogic.luhn_check(digits)
-
-        return False
+        return ValidationLogic.luhn_of_length(text, 9)
 
 
 class NovaScotiaValidator(ValidatorStrategy):
     """Validator for Nova Scotia Health Card Numbers."""
 
     def validate(self, text: str) -> bool:
-        digits = ValidationLogic.NON_DIGIT.sub("", text)
-        if len(digits) != 10:
-            return False
-        return ValidationLogic.luhn_check(digits)
+        return ValidationLogic.luhn_of_length(text, 10)
 
 
 class NewBrunswickValidator(ValidatorStrategy):
     """Validator for New Brunswick Medicare Numbers."""
 
     def validate(self, text: str) -> bool:
-        digits = ValidationLogic.NON_DIGIT.sub("", text)
-        if len(digits) != 9:
-            return False
-        return ValidationLogic.luhn_check(digits)
+        return ValidationLogic.luhn_of_length(text, 9)
 
 
 class NewfoundlandValidator(ValidatorStrategy):
     """Validator for Newfoundland and Labrador MCP Numbers."""
 
     def validate(self, text: str) -> bool:
-        digits = ValidationLogic.NON_DIGIT.sub("", text)
-        return len(digits) == 12 and digits.isdigit()
+        return len(ValidationLogic.strip_non_digits(text)) == 12
 
 
 class PEIValidator(ValidatorStrategy):
     """Validator for Prince Edward Island Health Numbers."""
 
     def validate(self, text: str) -> bool:
-        digits = ValidationLogic.NON_DIGIT.sub("", text)
-
-        if not digits.isdigit():
-            return False
+        digits = ValidationLogic.strip_non_digits(text)
 
         if len(digits) in (8, 10):
             return ValidationLogic.luhn_check(digits)
@@ -230,24 +252,19 @@ class NunavutValidator(ValidatorStrategy):
     """Validator for Nunavut Health Numbers."""
 
     def validate(self, text: str) -> bool:
-        digits = ValidationLogic.NON_DIGIT.sub("", text)
-        return len(digits) == 9 and digits.startswith("1") and digits.isdigit()
+        digits = ValidationLogic.strip_non_digits(text)
+        return len(digits) == 9 and digits.startswith("1")
 
 
 class YukonValidator(ValidatorStrategy):
     """Validator for Yukon Health Care Insurance Plan Numbers."""
 
     def validate(self, text: str) -> bool:
-        digits = ValidationLogic.NON_DIGIT.sub("", text)
-        return len(digits) == 9 and digits.isdigit()
-
-
-# Cache for validator instances to avoid repeated construction
-_validator_cache: Dict[str, ValidatorStrategy] = {}
+        return len(ValidationLogic.strip_non_digits(text)) == 9
 
 
 def get_validator(
-    province_code: str, keywords: Optional[List[str]] = None
+    province_code: str, keywords: Optional[Tuple[str, ...]] = None
 ) -> Optional[ValidatorStrategy]:
     """Factory method to retrieve province-specific validator.
 
@@ -255,16 +272,21 @@ def get_validator(
 
     Args:
         province_code: Two-letter province code (e.g., 'ON', 'BC')
-        keywords: Context keywords for validation
+        keywords: Context keywords for validation, as a hashable tuple
 
     Returns:
         ValidatorStrategy instance or None if province not found
     """
-    cache_key = f"{province_code}_{hash(tuple(keywords)) if keywords else 'None'}"
+    # One cache key per (code, keywords): lru_cache alone would key omitted,
+    # None and empty keywords separately
+    return _get_validator(province_code, keywords or None)
 
-    if cache_key in _validator_cache:
-        return _validator_cache[cache_key]
 
+@functools.lru_cache(maxsize=None)
+def _get_validator(
+    province_code: str, keywords: Optional[Tuple[str, ...]]
+) -> Optional[ValidatorStrategy]:
+    """Builds the validator for get_validator(), memoized per cache key."""
     lookup = {
         "ON": OntarioValidator,
         "BC": BCValidator,
@@ -284,9 +306,7 @@ def get_validator(
     validator_class = lookup.get(province_code)
 
     if validator_class:
-        instance = validator_class(context_keywords=keywords)
-        _validator_cache[cache_key] = instance
-        return instance
+        return validator_class(context_keywords=list(keywords) if keywords else None)
 
-    logger.warning(f"No validator found for province code: {province_code}")
+    logger.warning("No validator found for province code: %s", province_code)
     return None
@@ -1,85 +1,197 @@
 # redaction/service/config.py
 
-"""Application configuration using Pydantic Settings.
+"""Application configuration read from the environment.
 
 Manages environment variables, defaults, and validation rules.
 """
 
-from typing import List
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import json
+import os
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, Final, FrozenSet, Tuple
+
+from dotenv import dotenv_values
 
 from redaction.core.definitions import EntityType
+from redaction.core.exceptions import ConfigurationError
+
+# Settings are read from variables named ENV_PREFIX + field name (matched
+# case-insensitively); real environment variables override ENV_FILE entries.
+ENV_PREFIX = "REDACTION_"
+ENV_FILE = ".env"
+
+
+def _parse_names(raw: str) -> Tuple[str, ...]:
+    """Parses a name list given as a JSON array or comma-separated names.
+
+    Names are interned, like the EntityType values, so entity names compare
+    against detected entity types by identity first.
+    """
+    raw = raw.strip()
+    if raw.startswith("["):
+        values = json.loads(raw)
+        if not isinstance(values, list):
+            raise ValueError("expected a JSON array of entity names")
+        return tuple(sys.intern(str(v)) for v in values)
+    return tuple(sys.intern(v.strip()) for v in raw.split(",") if v.strip())
+
 
+# Entity types detected unless overridden; a single shared tuple
+_DEFAULT_ENTITIES: Tuple[str, ...] = (
+    # Provincial Health Numbers
+    EntityType.ON_HCN,
+    EntityType.BC_PHN,
+    EntityType.QC_RAMQ,
+    EntityType.AB_PHN,
+    EntityType.SK_HSN,
+    EntityType.MB_PHIN,
+    EntityType.NS_HCN,
+    EntityType.NB_MEDICARE,
+    EntityType.NL_MCP,
+    EntityType.PE_HEALTH,
+    EntityType.NT_HSN,
+    EntityType.NU_HEALTH,
+    EntityType.YT_YHCIP,
+    # General PII/PHI
+    EntityType.PATIENT_NAME,
+    EntityType.DOB,
+    EntityType.PHONE,
+    EntityType.EMAIL,
+    EntityType.ADDRESS,
+    EntityType.POSTAL_CODE,
+    EntityType.PROVINCE,
+    EntityType.BANK_ACCT,
+    EntityType.CREDIT_CARD,
+    EntityType.TX_ID,
+    EntityType.BANK_NAME,
+    EntityType.MRN,
+)
 
-class Settings(BaseSettings):
+
+# Converts the raw string value of each setting to its field type
+_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "spacy_model": str,
+    "confidence_threshold": float,
+    "result_cache_size": int,
+    "spacy_batch_size": int,
+    "spacy_n_process": int,
+    "min_redact_len": int,
+    "engine_pool_size": int,
+    "spacy_disable": _parse_names,
+    "default_entities": _parse_names,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Global application settings.
 
     Loads values from environment variables (prefix 'REDACTION_') or .env file.
-    """
 
-    model_config = SettingsConfigDict(
-        env_prefix="REDACTION_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
+    Attributes:
+        spacy_model: SpaCy model name to use for NLP
+        confidence_threshold: Minimum confidence score (0.0-1.0) for entity
+            retention
+        result_cache_size: Recent documents whose Pass 1 results are reused
+            across requests (0 disables); opt-in, since cached entries keep
+            PHI-derived data in memory after the request ends
+        spacy_batch_size: Documents per spaCy nlp.pipe() batch in batch
+            redaction
+        spacy_n_process: Worker processes for spaCy batch parsing (>1 only
+            pays off for medium/long documents)
+        min_redact_len: Inputs shorter than this are returned unchanged
+            without running the pipeline
+        engine_pool_size: Engines serving concurrent redact_text() calls;
+            each loads its own copy of the spaCy model
+        spacy_disable: SpaCy pipeline components to load disabled; parser,
+            tagger, attribute_ruler and lemmatizer feed role detection
+        default_entities: Entity types to detect by default
+    """
 
     # Core Settings
-    spacy_model: str = Field(
-        default="en_core_web_lg", description="SpaCy model name to use for NLP."
-    )
-
-    confidence_threshold: float = Field(
-        default=0.35,
-        ge=0.0,
-        le=1.0,
-        description="Minimum confidence score (0.0-1.0) for entity retention.",
-    )
+    spacy_model: str = "en_core_web_lg"
+    confidence_threshold: float = 0.35
+    result_cache_size: int = 0
+    spacy_batch_size: int = 64
+    spacy_n_process: int = 1
+    min_redact_len: int = 2
+    engine_pool_size: int = 1
+    spacy_disable: Tuple[str, ...] = ()
 
     # Entity Configuration
-    default_entities: List[str] = Field(
-        default_factory=lambda: [
-            # Provincial Health Numbers
-            EntityType.ON_HCN,
-            EntityType.BC_PHN,
-            EntityType.QC_RAMQ,
-            EntityType.AB_PHN,
-            EntityType.SK_HSN,
-            EntityType.MB_PHIN,
-            EntityType.NS_HCN,
-            EntityType.NB_MEDICARE,
-            EntityType.NL_MCP,
-            EntityType.PE_HEALTH,
-            EntityType.NT_HSN,
-            EntityType.NU_HEALTH,
-            EntityType.YT_YHCIP,
-            # General PII/PHI
-            EntityType.PATIENT_NAME,
-            EntityType.DOB,
-            EntityType.PHONE,
-            EntityType.EMAIL,
-            EntityType.ADDRESS,
-            EntityType.POSTAL_CODE,
-            EntityType.PROVINCE,
-            EntityType.BANK_ACCT,
-            EntityType.CREDIT_CARD,
-            EntityType.TX_ID,
-            EntityType.BANK_NAME,
-            EntityType.MRN,
-        ],
-        description="List of entity types to detect by default.",
-    )
-
-    @field_validator("spacy_model")
+    default_entities: Tuple[str, ...] = _DEFAULT_ENTITIES
+
+    def __post_init__(self) -> None:
+        """Validates setting ranges.
+
+        Raises:
+            ConfigurationError: If a value is out of range.
+        """
+        if not self.spacy_model.strip():
+            raise ConfigurationError("SpaCy model name cannot be empty")
+
+        if not 0.0 <= self.confidence_threshold <= 1.0:
+            raise ConfigurationError("confidence_threshold must be within 0.0-1.0")
+
+        for name, minimum in (
+            ("result_cache_size", 0),
+            ("spacy_batch_size", 1),
+            ("spacy_n_process", 1),
+            ("min_redact_len", 0),
+            ("engine_pool_size", 1),
+        ):
+            if getattr(self, name) < minimum:
+                raise ConfigurationError(f"{name} must be >= {minimum}")
+
     @classmethod
-    def validate_model_name(cls, v: str) -> str:
-        """Ensure model name is not empty."""
-        if not v.strip():
-            raise ValueError("SpaCy model name cannot be empty")
-        return v
+    def load(cls) -> "Settings":
+        """Builds settings from the .env file and environment variables.
+
+        Returns:
+            Validated Settings instance
+
+        Raises:
+            ConfigurationError: If a value cannot be parsed or is out of range.
+        """
+        raw_values: Dict[str, str] = {}
+
+        if os.path.exists(ENV_FILE):
+            raw_values.update(_prefixed(dotenv_values(ENV_FILE, encoding="utf-8")))
+        raw_values.update(_prefixed(os.environ))
+
+        values: Dict[str, Any] = {}
+        for field in fields(cls):
+            raw = raw_values.get(field.name)
+            if raw is None:
+                continue
+            try:
+                values[field.name] = _PARSERS[field.name](raw)
+            except ValueError as e:
+                raise ConfigurationError(
+                    f"Invalid value for {ENV_PREFIX}{field.name.upper()}: {e}"
+                ) from e
+
+        return cls(**values)
+
+
+def _prefixed(source: Any) -> Dict[str, str]:
+    """Returns prefixed variables from source keyed by lowercase field name."""
+    prefix_len = len(ENV_PREFIX)
+    return {
+        key[prefix_len:].lower(): value
+        for key, value in source.items()
+        if value is not None and key.upper().startswith(ENV_PREFIX)
+    }
+
 
+# Singleton settings instance. Settings is frozen, so attribute writes raise
+# FrozenInstanceError; Final marks the names themselves as never rebound.
+settings: Final[Settings] = Settings.load()
 
-# Singleton settings instance
-settings = Settings()
+# Snapshots read on every request. Plain module constants avoid a settings
+# attribute lookup per call.
+CONFIDENCE_THRESHOLD: Final[float] = settings.confidence_threshold
+MIN_REDACT_LEN: Final[int] = settings.min_redact_len
+# Set form for O(1) membership tests; the engine accepts any collection.
+DEFAULT_ENTITIES_SET: Final[FrozenSet[str]] = frozenset(settings.default_entities)
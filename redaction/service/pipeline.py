@@ -2,12 +2,20 @@
 
 """Main redaction service pipeline."""
 
+import contextlib
 import logging
+import queue
 import threading
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Tuple, cast
 
-from redaction.service.config import settings
+from redaction.service.config import (
+    CONFIDENCE_THRESHOLD,
+    DEFAULT_ENTITIES_SET,
+    MIN_REDACT_LEN,
+    settings,
+)
 from redaction.engine.presidio_wrapper import PresidioRedactionEngine
+from redaction.logging_config import ContextLoggerAdapter
 from redaction.core.domain import RedactionResult
 from redaction.core.exceptions import (
     InitializationError,
@@ -17,68 +25,189 @@ from redaction.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Request logs carry the static context once; calls add only per-request fields
+_request_logger = ContextLoggerAdapter(
+    logger, {"component": "redactor", "threshold": CONFIDENCE_THRESHOLD}
+)
+
+
+# Process-wide engine, built on first use. _engine_ready is set only after
+# _engine is assigned, so a reader that sees it set also sees the engine,
+# without a lock and without relying on CPython's GIL for the ordering.
+# Only the one-time construction is serialized.
+_engine: Optional[PresidioRedactionEngine] = None
+_engine_ready = threading.Event()
+_engine_lock = threading.Lock()
 
-class RedactionService:
-    """Singleton service wrapper for the redaction engine.
 
-    Manages engine lifecycle and provides thread-safe access to
-    the redaction functionality.
+def get_engine() -> PresidioRedactionEngine:
+    """Returns the process-wide redaction engine, building it on first use.
+
+    Returns:
+        Initialized PresidioRedactionEngine
+
+    Raises:
+        InitializationError: If engine initialization fails
     """
+    if _engine_ready.is_set():
+        return cast(PresidioRedactionEngine, _engine)
+    return _build_engine()
 
-    _instance: Optional[PresidioRedactionEngine] = None
-    _lock = threading.Lock()
-
-    @classmethod
-    def get_instance(cls) -> PresidioRedactionEngine:
-        """Returns singleton redaction engine instance.
-
-        Returns:
-            Initialized PresidioRedactionEngine
-
-        Raises:
-            InitializationError: If engine initialization fails
-        """
-        if cls._instance is None:
-            with cls._lock:
-                # Double-checked locking pattern
-                if cls._instance is None:
-                    try:
-                        logger.info("Initializing redaction engine")
-                        cls._instance = PresidioRedactionEngine(settings.spacy_model)
-                        logger.info("Redaction engine initialized successfully")
-
-                    except Exception as e:
-                        logger.error(
-                            "Failed to initialize redaction engine", exc_info=True
-                        )
-                        if isinstance(e, InitializationError):
-                            raise
-                        raise InitializationError(
-                            "Redaction engine initialization failed"
-                        ) from e
-
-        return cls._instance
-
-
-def redact_text(text: str) -> RedactionResult:
-    """Main entry point for text redaction.
+
+def _build_engine() -> PresidioRedactionEngine:
+    """Constructs and publishes the engine exactly once across threads."""
+    global _engine
+
+    with _engine_lock:
+        if not _engine_ready.is_set():
+            _engine = _new_engine()
+            _engine_ready.set()
+
+        return cast(PresidioRedactionEngine, _engine)
+
+
+def _new_engine() -> PresidioRedactionEngine:
+    """Constructs one engine from the current settings.
+
+    Raises:
+        InitializationError: If engine initialization fails
+    """
+    try:
+        logger.info("Initializing redaction engine")
+        engine = PresidioRedactionEngine(
+            settings.spacy_model,
+            result_cache_size=settings.result_cache_size,
+            batch_size=settings.spacy_batch_size,
+            n_process=settings.spacy_n_process,
+            spacy_disable=settings.spacy_disable,
+        )
+        logger.info("Redaction engine initialized successfully")
+        return engine
+
+    except Exception as e:
+        logger.error("Failed to initialize redaction engine", exc_info=True)
+        if isinstance(e, InitializationError):
+            raise
+        raise InitializationError("Redaction engine initialization failed") from e
+
+
+# Engines available to concurrent redact_text() calls: get_engine()'s engine
+# plus engine_pool_size - 1 more. Each engine holds its own spaCy pipeline,
+# so Presidio orchestration in one request does not serialize the others.
+_engine_pool: List[PresidioRedactionEngine] = []
+_engine_pool_ready = threading.Event()
+_idle_engines: "queue.SimpleQueue[PresidioRedactionEngine]" = queue.SimpleQueue()
+
+
+def _get_pool() -> List[PresidioRedactionEngine]:
+    """Returns every pooled engine, building the pool on first use.
+
+    Raises:
+        InitializationError: If engine initialization fails
+    """
+    if not _engine_pool_ready.is_set():
+        primary = get_engine()
+        with _engine_lock:
+            if not _engine_pool_ready.is_set():
+                engines = [primary]
+                for _ in range(settings.engine_pool_size - 1):
+                    engines.append(_new_engine())
+                for engine in engines:
+                    _idle_engines.put(engine)
+                _engine_pool.extend(engines)
+                _engine_pool_ready.set()
+
+    return _engine_pool
+
+
+@contextlib.contextmanager
+def lease_engine() -> Iterator[PresidioRedactionEngine]:
+    """Lends an idle pooled engine for the duration of the block.
+
+    Blocks while every engine is in use; the engine is returned to the pool
+    on exit, even if the block raises.
+
+    Raises:
+        InitializationError: If engine initialization fails
+    """
+    _get_pool()
+    engine = _idle_engines.get()
+    try:
+        yield engine
+    finally:
+        _idle_engines.put(engine)
+
+
+# Synthetic note for warmup(); exercises NER, the role extractor and Pass 2
+_WARMUP_TEXT = "Patient John Smith was seen by Dr. Jane Doe on 2024-01-15."
+
+
+def warmup() -> None:
+    """Builds the engine pool and runs one synthetic document through each.
+
+    Call from the application's startup hook so the first real request does
+    not pay for loading the spaCy model or for the lazy work done on its
+    first document. Engines are leased, so warmup waits for any a request
+    is using.
+
+    Raises:
+        InitializationError: If engine initialization fails
+    """
+    engines = _get_pool()
+    # Each engine is leased like any request's, so warmup never runs one a
+    # concurrent request holds; leases are kept until the end so every
+    # iteration receives a different engine
+    with contextlib.ExitStack() as leases:
+        for _ in engines:
+            engine = leases.enter_context(lease_engine())
+            engine.process(_WARMUP_TEXT, DEFAULT_ENTITIES_SET, CONFIDENCE_THRESHOLD)
+    logger.info("Redaction engines warmed up", extra={"engine_count": len(engines)})
+
+
+def clear_result_caches() -> None:
+    """Drops the cross-request result cache of every engine built so far.
+
+    Only relevant when settings.result_cache_size is non-zero; call it to
+    end the retention of PHI-derived data (e.g. at session end or shutdown).
+    """
+    with _engine_lock:
+        engines = list(_engine_pool) or ([_engine] if _engine is not None else [])
+    for engine in engines:
+        engine.clear_result_cache()
+
+
+def _error_result(
+    text: str, error_msg: str, error_type: Optional[str] = None
+) -> RedactionResult:
+    """Builds the failed result returned when processing raises.
+
+    The input is returned unredacted; callers must check metadata["error"].
 
     Args:
-        text: Input text to redact
+        text: Original input text
+        error_msg: User-safe error description
+        error_type: Exception class name for known error types
 
     Returns:
-        RedactionResult with redacted text and metadata.
-        On failure, returns a result indicating the error safely.
+        RedactionResult flagged with status "failed"
     """
-    if not text:
-        logger.warning("Empty text provided for redaction")
-        return RedactionResult(
-            original_text="",
-            redacted_text="",
-            metadata={"error": "Empty input provided"},
-        )
+    metadata = {"error": error_msg, "status": "failed"}
+    if error_type:
+        metadata["error_type"] = error_type
+    return RedactionResult(original_text=text, redacted_text=text, metadata=metadata)
+
 
-    if not isinstance(text, str):
+def _precheck(text: str) -> Optional[RedactionResult]:
+    """Returns the result for input the engine need not see, else None."""
+    # Callers are trusted to pass str, so there is no per-call type check;
+    # a non-str argument fails one of the str operations below and is
+    # answered here instead (the try costs nothing when nothing is raised)
+    try:
+        empty = not text
+        # Whitespace-only or very short inputs cannot hold an entity worth
+        # the cost of the NLP pipeline
+        trivial = empty or text.isspace() or len(text) < MIN_REDACT_LEN
+    except (TypeError, AttributeError, ValueError):
         logger.error(f"Invalid input type received: {type(text)}")
         return RedactionResult(
             original_text=str(text),
@@ -86,54 +215,143 @@ def redact_text(text: str) -> RedactionResult:
             metadata={"error": "Invalid input format"},
         )
 
-    try:
-        engine = RedactionService.get_instance()
-
-        logger.info(
-            "Starting redaction request",
-            extra={
-                "text_length": len(text),
-                "threshold": settings.confidence_threshold,
-            },
+    if empty:
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Empty text provided for redaction")
+        return RedactionResult(
+            original_text="",
+            redacted_text="",
+            metadata={"error": "Empty input provided"},
         )
 
-        result = engine.process(
-            text=text,
-            entities=settings.default_entities,
-            threshold=settings.confidence_threshold,
+    if trivial:
+        return RedactionResult(
+            original_text=text,
+            redacted_text=text,
+            metadata={"skipped": "trivial_input"},
         )
 
-        return result
+    return None
+
+
+def _log_failure(e: Exception, text_length: int) -> Tuple[str, Optional[str]]:
+    """Logs a processing failure and returns its user-safe description.
 
-    except (InitializationError, PipelineError, ValidationError) as e:
-        # These are known errors, log with context but hide internal details in response
+    Args:
+        e: Exception raised while processing
+        text_length: Total length of the input(s) being processed
+
+    Returns:
+        Tuple of (error message, error type for known errors or None)
+    """
+    if isinstance(e, (InitializationError, PipelineError, ValidationError)):
+        # Known errors: log with context but hide internal details in response
         logger.error(
             f"Known error during redaction: {type(e).__name__}",
             exc_info=True,
-            extra={"text_length": len(text)},
+            extra={"text_length": text_length},
         )
-        return RedactionResult(
-            original_text=text,
-            redacted_text=text,
-            metadata={
-                "error": "The redaction service encountered a processing error.",
-                "status": "failed",
-                "error_type": type(e).__name__,
-            },
+        return (
+            "The redaction service encountered a processing error.",
+            type(e).__name__,
         )
 
-    except Exception:
-        # Catch-all for unexpected bugs
-        logger.error(
-            "Unexpected critical error in redaction pipeline",
-            exc_info=True,
-            extra={"text_length": len(text)},
-        )
-        return RedactionResult(
-            original_text=text,
-            redacted_text=text,
-            metadata={
-                "error": "An unexpected system error occurred.",
-                "status": "failed",
-            },
+    # Catch-all for unexpected bugs
+    logger.error(
+        "Unexpected critical error in redaction pipeline",
+        exc_info=True,
+        extra={"text_length": text_length},
+    )
+    return "An unexpected system error occurred.", None
+
+
+def redact_text(
+    text: str, engine: Optional[PresidioRedactionEngine] = None
+) -> RedactionResult:
+    """Main entry point for text redaction.
+
+    Args:
+        text: Input text to redact
+        engine: Already-initialized engine to use (e.g. one cached by the
+            UI); an engine is leased from the pool when omitted
+
+    Returns:
+        RedactionResult with redacted text and metadata.
+        On failure, returns a result indicating the error safely.
+    """
+    precheck = _precheck(text)
+    if precheck is not None:
+        return precheck
+
+    # Gated so the extra dict is only built when INFO is enabled
+    if _request_logger.isEnabledFor(logging.INFO):
+        _request_logger.info(
+            "Starting redaction request", extra={"text_length": len(text)}
         )
+
+    # Leasing stays inside the try: building the pool on first use may
+    # raise InitializationError
+    try:
+        with (
+            lease_engine() if engine is None else contextlib.nullcontext(engine)
+        ) as active_engine:
+            result = active_engine.process(
+                text=text,
+                entities=DEFAULT_ENTITIES_SET,
+                threshold=CONFIDENCE_THRESHOLD,
+            )
+
+        return result
+
+    except Exception as e:
+        error_msg, error_type = _log_failure(e, len(text))
+        return _error_result(text, error_msg, error_type)
+
+
+def redact_texts(
+    texts: Iterable[str], engine: Optional[PresidioRedactionEngine] = None
+) -> List[RedactionResult]:
+    """Redacts several documents with one batched spaCy pass.
+
+    Invalid, empty and trivial inputs are answered as in redact_text(); the
+    rest go through the engine's process_batch(), which parses them with
+    nlp.pipe() in batches.
+
+    Args:
+        texts: Input texts to redact
+        engine: Already-initialized engine to use; an engine is leased from
+            the pool when omitted
+
+    Returns:
+        RedactionResult per input text, in input order. If the batch fails,
+        every non-trivial input gets an error result.
+    """
+    texts = list(texts)
+    results: List[Optional[RedactionResult]] = [_precheck(t) for t in texts]
+    pending = [i for i, result in enumerate(results) if result is None]
+
+    if pending:
+        batch = [texts[i] for i in pending]
+        batch_length = sum(len(t) for t in batch)
+
+        if _request_logger.isEnabledFor(logging.INFO):
+            _request_logger.info(
+                "Starting batch redaction request",
+                extra={"batch_size": len(batch), "text_length": batch_length},
+            )
+
+        try:
+            with (
+                lease_engine() if engine is None else contextlib.nullcontext(engine)
+            ) as active_engine:
+                batch_results = active_engine.process_batch(
+                    batch, DEFAULT_ENTITIES_SET, CONFIDENCE_THRESHOLD
+                )
+        except Exception as e:
+            error_msg, error_type = _log_failure(e, batch_length)
+            batch_results = [_error_result(t, error_msg, error_type) for t in batch]
+
+        for i, result in zip(pending, batch_results):
+            results[i] = result
+
+    return cast(List[RedactionResult], results)
@@ -0,0 +1,268 @@
+# tests/test_cache.py
+
+"""Tests for the request-scoped patient name cache and its matchers."""
+
+import contextlib
+import random
+import re
+import unittest
+from unittest import mock
+
+from redaction.engine import cache
+from redaction.engine.cache import PatientNameCache, patient_name_scope
+
+# Matcher backends as (use pyahocorasick, use hyperscan)
+BACKENDS = {
+    "hyperscan+automaton": (True, True),
+    "hyperscan": (False, True),
+    "automaton": (True, False),
+    "regex": (False, False),
+}
+
+NAMES = [
+    "John Smith",
+    "José García",
+    "Mary-Ann O'Neil",
+    "Li",
+    "Robert Robertson",
+    "Rob",
+    "ANNA",
+    "Lıam Cosſa",
+    "Σοφία Νικολάου",
+]
+
+# Fragments random documents are built from: names in several cases, word
+# characters that break word boundaries, and characters whose lowercase
+# form or regex case folding differs from plain ASCII
+FRAGMENTS = [
+    "john",
+    "JOHN",
+    "Smith",
+    "Smithe",
+    "josé",
+    "GARCÍA",
+    "robert",
+    "ROB",
+    "robertson",
+    "anna",
+    "mary-ann",
+    "o'neil",
+    "li",
+    "LIAM",
+    "cossa",
+    "ΣΟΦΊΑ",
+    "σοφια",
+    "νικολάου",
+    " ",
+    "  ",
+    "-",
+    "_",
+    "1",
+    ".",
+    "\n",
+    "x",
+    "é",
+    "İ",
+    "ı",
+    "K",
+    "ß",
+]
+
+
+@contextlib.contextmanager
+def backend(use_automaton, use_hyperscan):
+    """Forces the optional matcher imports to None where a backend is unused."""
+    if use_automaton and cache.ahocorasick is None:
+        raise unittest.SkipTest("pyahocorasick not installed")
+    if use_hyperscan and cache.hyperscan is None:
+        raise unittest.SkipTest("hyperscan not installed")
+    with (
+        mock.patch.object(
+            cache, "ahocorasick", cache.ahocorasick if use_automaton else None
+        ),
+        mock.patch.object(
+            cache, "hyperscan", cache.hyperscan if use_hyperscan else None
+        ),
+    ):
+        yield
+
+
+def reference_parts(name_cache, text):
+    """Name part spans as the baseline Pass 2 regex finds them."""
+    if not name_cache.name_parts:
+        return []
+    parts = sorted(name_cache.name_parts, key=len, reverse=True)
+    pattern = re.compile(
+        r"\b(?:" + "|".join(re.escape(p) for p in parts) + r")\b", re.IGNORECASE
+    )
+    return [m.span() for m in pattern.finditer(text)]
+
+
+def reference_full_names(name_cache, text):
+    """Full name spans as the baseline Pass 2 per-name search finds them."""
+    spans = []
+    for full_name in name_cache.full_names:
+        pattern = re.compile(re.escape(full_name), re.IGNORECASE)
+        spans.extend(m.span() for m in pattern.finditer(text))
+    return sorted(spans)
+
+
+def random_documents(seed, count):
+    """Yields (names, text, freeze) cases for differential tests."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        names = rng.sample(NAMES, rng.randint(1, 4))
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 15)))
+        yield names, text, rng.random() < 0.5
+
+
+def build_cache(names, freeze):
+    name_cache = PatientNameCache()
+    for name in names:
+        name_cache.add_full_name(name)
+    if freeze:
+        name_cache.freeze()
+    return name_cache
+
+
+class IterMatchesTest(unittest.TestCase):
+    def test_matches_baseline_regex(self):
+        for label, flags in BACKENDS.items():
+            with self.subTest(backend=label), backend(*flags):
+                for names, text, freeze in random_documents(7, 3000):
+                    name_cache = build_cache(names, freeze)
+                    self.assertEqual(
+                        list(name_cache.iter_matches(text)),
+                        reference_parts(name_cache, text),
+                        (names, text),
+                    )
+
+    def test_case_insensitive_whole_words(self):
+        text = "JOHN smith, Johnson john_x Smith. xSmith Smith1 (smith)"
+        expected = [(0, 4), (5, 10), (27, 32), (49, 54)]
+        for label, flags in BACKENDS.items():
+            with self.subTest(backend=label), backend(*flags):
+                name_cache = build_cache(["John Smith"], freeze=True)
+                spans = list(name_cache.iter_matches(text))
+                self.assertEqual(spans, expected)
+                for start, end in spans:
+                    self.assertTrue(name_cache.is_patient_name(text[start:end]))
+
+    def test_longest_part_wins(self):
+        text = "Robertson, Robert and Rob"
+        for label, flags in BACKENDS.items():
+            with self.subTest(backend=label), backend(*flags):
+                name_cache = build_cache(["Robert Robertson", "Rob"], freeze=True)
+                spans = list(name_cache.iter_matches(text))
+                self.assertEqual(
+                    [text[start:end] for start, end in spans],
+                    ["Robertson", "Robert", "Rob"],
+                )
+
+    def test_automaton_only_with_pyahocorasick(self):
+        with backend(*BACKENDS["regex"]):
+            self.assertIsNone(PatientNameCache()._automaton)
+        with backend(*BACKENDS["automaton"]):
+            self.assertIsNotNone(PatientNameCache()._automaton)
+
+    def test_hyperscan_scans_ascii_text(self):
+        with backend(*BACKENDS["hyperscan"]):
+            name_cache = build_cache(["John Smith"], freeze=True)
+            self.assertTrue(name_cache._hs_db)
+            self.assertEqual(
+                name_cache._scan_hyperscan("xx JOHN smith"), [(3, 7), (8, 13)]
+            )
+            # Raw occurrences; word boundaries are applied by iter_matches()
+            self.assertEqual(name_cache._scan_hyperscan("Johnson"), [(0, 4)])
+            self.assertEqual(list(name_cache.iter_matches("Johnson")), [])
+
+    def test_no_parts(self):
+        for label, flags in BACKENDS.items():
+            with self.subTest(backend=label), backend(*flags):
+                name_cache = build_cache(["Li"], freeze=True)
+                self.assertEqual(list(name_cache.iter_matches("Li li LI")), [])
+
+
+class MatchNamesTest(unittest.TestCase):
+    def test_matches_baseline_search(self):
+        for label, flags in BACKENDS.items():
+            with self.subTest(backend=label), backend(*flags):
+                for names, text, freeze in random_documents(11, 3000):
+                    name_cache = build_cache(names, freeze)
+                    self.assertEqual(
+                        name_cache.match_names(text),
+                        (
+                            reference_full_names(name_cache, text),
+                            reference_parts(name_cache, text),
+                        ),
+                        (names, text),
+                    )
+
+    def test_full_names_ignore_word_boundaries(self):
+        text = "JOHN SMITH; xjohn smithy and John Smith John Smith"
+        for label, flags in BACKENDS.items():
+            with self.subTest(backend=label), backend(*flags):
+                name_cache = build_cache(["John Smith"], freeze=True)
+                full_spans, part_spans = name_cache.match_names(text)
+                self.assertEqual(full_spans, [(0, 10), (13, 23), (29, 39), (40, 50)])
+                for start, end in full_spans:
+                    self.assertTrue(name_cache.is_patient_name(text[start:end]))
+                self.assertEqual(part_spans, list(name_cache.iter_matches(text)))
+
+    def test_overlapping_full_names(self):
+        # One name's matches never overlap; different names may
+        text = "anna annanna"
+        for label, flags in BACKENDS.items():
+            with self.subTest(backend=label), backend(*flags):
+                name_cache = build_cache(["Anna", "Nna"], freeze=True)
+                full_spans, _ = name_cache.match_names(text)
+                self.assertEqual(full_spans, [(0, 4), (1, 4), (5, 9), (6, 9), (9, 12)])
+
+    def test_names_added_after_freeze(self):
+        for label, flags in BACKENDS.items():
+            with self.subTest(backend=label), backend(*flags):
+                name_cache = build_cache(["John Smith"], freeze=True)
+                name_cache.add_full_name("Jane Doe")
+                text = "Jane Doe and John Smith"
+                self.assertEqual(
+                    name_cache.match_names(text),
+                    (
+                        reference_full_names(name_cache, text),
+                        reference_parts(name_cache, text),
+                    ),
+                )
+
+
+class PatientNameScopeTest(unittest.TestCase):
+    def test_fresh_cache_per_document(self):
+        with patient_name_scope() as first:
+            first.add_full_name("John Smith")
+            self.assertIs(PatientNameCache.get_instance(), first)
+
+        with patient_name_scope() as second:
+            self.assertIsNot(second, first)
+            self.assertIs(PatientNameCache.get_instance(), second)
+            self.assertFalse(second.initialized)
+            self.assertFalse(second.is_patient_name("John Smith"))
+            self.assertEqual(list(second.iter_matches("John Smith")), [])
+
+    def test_nested_scope_restores_outer(self):
+        with patient_name_scope() as outer:
+            outer.add_full_name("John Smith")
+            with patient_name_scope() as inner:
+                self.assertIs(PatientNameCache.get_instance(), inner)
+                self.assertFalse(inner.is_patient_name("smith"))
+            self.assertIs(PatientNameCache.get_instance(), outer)
+            self.assertTrue(outer.is_patient_name("smith"))
+
+    def test_scope_exit_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with patient_name_scope() as failed:
+                failed.add_full_name("John Smith")
+                raise RuntimeError
+        with patient_name_scope() as after:
+            self.assertFalse(after.is_patient_name("smith"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+# tests/test_config.py
+
+"""Tests for loading settings from the environment and the .env file."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from redaction.core.definitions import EntityType
+from redaction.core.exceptions import ConfigurationError
+from redaction.service import config
+from redaction.service.config import Settings
+
+
+class SettingsLoadTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.env_file = Path(tmp.name) / ".env"
+
+        patcher = mock.patch.object(config, "ENV_FILE", str(self.env_file))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Start from an environment without REDACTION_ variables
+        environ = {
+            k: v
+            for k, v in os.environ.items()
+            if not k.upper().startswith("REDACTION_")
+        }
+        patcher = mock.patch.dict(os.environ, environ, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_env_file(self, *lines):
+        self.env_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def test_defaults_without_sources(self):
+        self.assertEqual(Settings.load(), Settings())
+
+    def test_env_file_values(self):
+        self.write_env_file(
+            "REDACTION_CONFIDENCE_THRESHOLD=0.6",
+            "redaction_engine_pool_size=3",
+            "OTHER_SETTING=ignored",
+        )
+        loaded = Settings.load()
+        self.assertEqual(loaded.confidence_threshold, 0.6)
+        self.assertEqual(loaded.engine_pool_size, 3)
+
+    def test_environment_overrides_env_file(self):
+        self.write_env_file(
+            "REDACTION_CONFIDENCE_THRESHOLD=0.6", "REDACTION_MIN_REDACT_LEN=5"
+        )
+        os.environ["REDACTION_CONFIDENCE_THRESHOLD"] = "0.8"
+        loaded = Settings.load()
+        self.assertEqual(loaded.confidence_threshold, 0.8)
+        self.assertEqual(loaded.min_redact_len, 5)
+
+    def test_entity_lists_as_json_or_comma_list(self):
+        expected = (EntityType.PHONE, EntityType.EMAIL)
+        for raw in (
+            '["PHONE_NUMBER", "EMAIL_ADDRESS"]',
+            " PHONE_NUMBER, EMAIL_ADDRESS,",
+        ):
+            with self.subTest(raw=raw):
+                os.environ["REDACTION_DEFAULT_ENTITIES"] = raw
+                self.assertEqual(Settings.load().default_entities, expected)
+
+    def test_names_are_interned(self):
+        os.environ["REDACTION_SPACY_DISABLE"] = "".join(["ner", ",", "pars", "er"])
+        loaded = Settings.load()
+        self.assertEqual(loaded.spacy_disable, ("ner", "parser"))
+        self.assertIs(loaded.spacy_disable[1], "parser")
+
+    def test_invalid_json_list(self):
+        for raw in ('["PHONE_NUMBER"', "[PHONE_NUMBER]"):
+            with self.subTest(raw=raw):
+                os.environ["REDACTION_DEFAULT_ENTITIES"] = raw
+                with self.assertRaises(ConfigurationError):
+                    Settings.load()
+
+    def test_invalid_thresholds(self):
+        for raw in ("1.5", "-0.1", "high"):
+            with self.subTest(raw=raw):
+                os.environ["REDACTION_CONFIDENCE_THRESHOLD"] = raw
+                with self.assertRaises(ConfigurationError):
+                    Settings.load()
+
+    def test_out_of_range_sizes(self):
+        for name, raw in (
+            ("ENGINE_POOL_SIZE", "0"),
+            ("RESULT_CACHE_SIZE", "-1"),
+            ("SPACY_BATCH_SIZE", "ten"),
+        ):
+            with (
+                self.subTest(name=name),
+                mock.patch.dict(os.environ, {f"REDACTION_{name}": raw}),
+            ):
+                with self.assertRaises(ConfigurationError):
+                    Settings.load()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+# tests/test_pipeline.py
+
+"""Tests for the redaction service pipeline."""
+
+import queue
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from redaction.service import pipeline
+
+
+class PrecheckTest(unittest.TestCase):
+    def test_non_str_input_gets_invalid_format(self):
+        for value in (3, 4.5, ["a b c"], {"k": 1}, object()):
+            with self.subTest(value=value), self.assertLogs(pipeline.logger, "ERROR"):
+                result = pipeline._precheck(value)
+                self.assertEqual(result.metadata, {"error": "Invalid input format"})
+                self.assertEqual(result.redacted_text, str(value))
+
+    def test_empty_input(self):
+        for value in ("", None):
+            with self.subTest(value=value):
+                result = pipeline._precheck(value)
+                self.assertEqual(result.metadata, {"error": "Empty input provided"})
+                self.assertEqual(result.redacted_text, "")
+
+    def test_trivial_input_skipped(self):
+        for value in (" \n\t ", "a" * (pipeline.MIN_REDACT_LEN - 1)):
+            with self.subTest(value=value):
+                result = pipeline._precheck(value)
+                self.assertEqual(result.metadata, {"skipped": "trivial_input"})
+                self.assertEqual(result.redacted_text, value)
+
+    def test_text_passes_through(self):
+        self.assertIsNone(pipeline._precheck("Patient John Smith seen today."))
+
+
+class _FakeEngine:
+    def __init__(self):
+        self.cleared = 0
+
+    def clear_result_cache(self):
+        self.cleared += 1
+
+
+class ClearResultCachesTest(unittest.TestCase):
+    def test_clears_every_pooled_engine(self):
+        engines = [_FakeEngine(), _FakeEngine()]
+        with mock.patch.object(pipeline, "_engine_pool", engines):
+            pipeline.clear_result_caches()
+        self.assertEqual([e.cleared for e in engines], [1, 1])
+
+    def test_clears_primary_engine_before_pool_is_built(self):
+        engine = _FakeEngine()
+        with (
+            mock.patch.object(pipeline, "_engine_pool", []),
+            mock.patch.object(pipeline, "_engine", engine),
+        ):
+            pipeline.clear_result_caches()
+        self.assertEqual(engine.cleared, 1)
+
+    def test_no_engine_built(self):
+        with (
+            mock.patch.object(pipeline, "_engine_pool", []),
+            mock.patch.object(pipeline, "_engine", None),
+        ):
+            pipeline.clear_result_caches()
+
+
+class _PooledEngine:
+    """Stand-in engine that records overlapping use."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.busy = False
+        self.overlaps = 0
+        self.texts = []
+
+    def process(self, text, entities, threshold):
+        with self._lock:
+            if self.busy:
+                self.overlaps += 1
+            self.busy = True
+        time.sleep(0.001)
+        self.texts.append(text)
+        with self._lock:
+            self.busy = False
+
+
+class EnginePoolTest(unittest.TestCase):
+    def setUp(self):
+        self.engines = [_PooledEngine() for _ in range(3)]
+        self.use_pool(self.engines)
+
+    def use_pool(self, engines):
+        idle = queue.SimpleQueue()
+        for engine in engines:
+            idle.put(engine)
+        ready = threading.Event()
+        ready.set()
+        for name, value in (
+            ("_engine_pool", list(engines)),
+            ("_engine_pool_ready", ready),
+            ("_idle_engines", idle),
+        ):
+            patcher = mock.patch.object(pipeline, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def lease_and_process(self, text):
+        with pipeline.lease_engine() as engine:
+            engine.process(text, frozenset(), 0.5)
+
+    def test_one_holder_per_engine(self):
+        with ThreadPoolExecutor(max_workers=12) as executor:
+            list(executor.map(self.lease_and_process, ["doc"] * 300))
+
+        self.assertEqual([e.overlaps for e in self.engines], [0, 0, 0])
+        self.assertEqual(sum(len(e.texts) for e in self.engines), 300)
+        self.assertEqual(pipeline._idle_engines.qsize(), len(self.engines))
+
+    def test_engine_returned_when_block_raises(self):
+        with self.assertRaises(RuntimeError):
+            with pipeline.lease_engine():
+                raise RuntimeError
+        self.assertEqual(pipeline._idle_engines.qsize(), len(self.engines))
+
+    def test_warmup_leases_each_engine_once(self):
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            requests = executor.map(self.lease_and_process, ["doc"] * 100)
+            pipeline.warmup()
+            list(requests)
+
+        for engine in self.engines:
+            self.assertEqual(engine.overlaps, 0)
+            self.assertEqual(engine.texts.count(pipeline._WARMUP_TEXT), 1)
+        self.assertEqual(pipeline._idle_engines.qsize(), len(self.engines))
+
+    def test_warmup_waits_for_leased_engine(self):
+        engine = _PooledEngine()
+        self.use_pool([engine])
+
+        with pipeline.lease_engine():
+            warmup = threading.Thread(target=pipeline.warmup)
+            warmup.start()
+            warmup.join(0.05)
+            self.assertTrue(warmup.is_alive())
+            self.assertEqual(engine.texts, [])
+
+        warmup.join()
+        self.assertEqual(engine.texts, [pipeline._WARMUP_TEXT])
+
+
+if __name__ == "__main__":
+    unittest.main()
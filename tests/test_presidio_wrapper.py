@@ -0,0 +1,90 @@
+# tests/test_presidio_wrapper.py
+
+"""Tests for the Presidio redaction engine wrapper."""
+
+import random
+import unittest
+
+from presidio_analyzer import RecognizerResult
+from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer.entities import OperatorConfig
+
+from redaction.engine.presidio_wrapper import PresidioRedactionEngine
+
+ENTITY_TYPES = ["A", "B", "C"]
+
+
+class FastReplaceTest(unittest.TestCase):
+    """_fast_replace() must match AnonymizerEngine.anonymize() with replace."""
+
+    def setUp(self):
+        self.anonymizer = AnonymizerEngine()
+        self.replacements = {t: f"<{t}>" for t in ENTITY_TYPES}
+
+    def assertMatchesAnonymizer(self, text, results):
+        operators = {
+            t: OperatorConfig("replace", {"new_value": tag})
+            for t, tag in self.replacements.items()
+        }
+        expected = self.anonymizer.anonymize(
+            text=text, analyzer_results=results, operators=operators
+        ).text
+        actual = PresidioRedactionEngine._fast_replace(text, results, self.replacements)
+        self.assertEqual(
+            actual,
+            expected,
+            msg=f"{text!r} {[(r.entity_type, r.start, r.end, r.score) for r in results]}",
+        )
+
+    def test_equal_span_and_score_with_different_types(self):
+        self.assertMatchesAnonymizer(
+            ".a\t\t\n\n\t aa",
+            [RecognizerResult("B", 8, 10, 0.9), RecognizerResult("C", 8, 10, 0.9)],
+        )
+
+    def test_space_gap_ending_in_newline_joined(self):
+        # Presidio's "^( )+$" gap test also accepts a single trailing newline
+        self.assertMatchesAnonymizer(
+            "Pt John  \nSmith seen",
+            [
+                RecognizerResult("A", 3, 7, 0.9),
+                RecognizerResult("A", 10, 15, 0.6),
+                RecognizerResult("B", 16, 20, 0.5),
+            ],
+        )
+
+    def test_space_separated_neighbours_joined(self):
+        self.assertMatchesAnonymizer(
+            "Patient John  Smith seen",
+            [RecognizerResult("A", 8, 12, 0.9), RecognizerResult("A", 14, 19, 0.8)],
+        )
+
+    def test_randomized_span_sets(self):
+        rnd = random.Random(0)
+        for _ in range(5000):
+            length = rnd.randint(1, 30)
+            text = "".join(rnd.choice(".a \t\n ") for _ in range(length))
+            results = []
+            for _ in range(rnd.randint(0, 8)):
+                start = rnd.randint(0, length - 1)
+                end = rnd.randint(start + 1, length)
+                results.append(
+                    RecognizerResult(
+                        rnd.choice(ENTITY_TYPES),
+                        start,
+                        end,
+                        rnd.choice([0.5, 0.6, 0.9]),
+                    )
+                )
+            self.assertMatchesAnonymizer(text, results)
+
+    def test_results_not_modified(self):
+        results = [RecognizerResult("A", 0, 4, 0.9), RecognizerResult("A", 2, 6, 0.5)]
+        PresidioRedactionEngine._fast_replace("abcdefgh", results, self.replacements)
+        self.assertEqual(
+            [(r.start, r.end, r.score) for r in results], [(0, 4, 0.9), (2, 6, 0.5)]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
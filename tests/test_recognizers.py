@@ -0,0 +1,163 @@
+# tests/test_recognizers.py
+
+"""Tests for the custom Presidio recognizers."""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import spacy
+from presidio_analyzer import AnalyzerEngine, PatternRecognizer, RecognizerRegistry
+from presidio_analyzer.nlp_engine import SpacyNlpEngine
+
+from redaction.core.definitions import EntityType
+from redaction.engine import recognizers
+from redaction.engine.recognizers import (
+    CreditCardRecognizer,
+    RegexBundleRecognizer,
+    _get_cached_patterns,
+)
+
+SAMPLES_DIR = Path(__file__).resolve().parent.parent / "samples"
+
+BUNDLE_ENTITIES = [
+    EntityType.PHONE,
+    EntityType.EMAIL,
+    EntityType.ADDRESS,
+    EntityType.DOB,
+    EntityType.POSTAL_CODE,
+    EntityType.PROVINCE,
+    EntityType.BANK_ACCT,
+    EntityType.TX_ID,
+    EntityType.BANK_NAME,
+    EntityType.MRN,
+]
+
+SAMPLE_TEXT = (
+    "Patient MRN: 4482910, DOB 1984-03-12. Lives at 42 Maple Street, "
+    "Toronto, Ontario M5V 2T6. Phone (416) 555-0199, email jane@example.com. "
+    "Refund sent from RBC account 12345-678-9012345, transaction TX-99812. "
+) * 20
+
+
+@unittest.skipIf(recognizers.hyperscan is None, "hyperscan not installed")
+class RegexBundleRecognizerTest(unittest.TestCase):
+    def test_concurrent_analyze(self):
+        recognizer = RegexBundleRecognizer(BUNDLE_ENTITIES)
+
+        def spans():
+            results = recognizer.analyze(SAMPLE_TEXT, BUNDLE_ENTITIES)
+            return sorted((r.entity_type, r.start, r.end, r.score) for r in results)
+
+        expected = spans()
+        self.assertTrue(expected)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(spans) for _ in range(40)]
+            outcomes = [f.result() for f in futures]
+
+        for outcome in outcomes:
+            self.assertEqual(outcome, expected)
+
+    def test_matches_per_entity_recognizers(self):
+        nlp_engine = SpacyNlpEngine(models=[{"lang_code": "en", "model_name": "blank"}])
+        # A blank pipeline: these recognizers only need the tokenizer
+        nlp_engine.nlp = {"en": spacy.blank("en")}
+
+        def analyzer(recognizer_list):
+            registry = RecognizerRegistry(supported_languages=["en"])
+            for recognizer in recognizer_list:
+                registry.add_recognizer(recognizer)
+            return AnalyzerEngine(
+                registry=registry, nlp_engine=nlp_engine, supported_languages=["en"]
+            )
+
+        bundled = analyzer([RegexBundleRecognizer(BUNDLE_ENTITIES)])
+        per_entity = analyzer(
+            [
+                PatternRecognizer(
+                    supported_entity=entity,
+                    name=f"Regex_{entity}_Recognizer",
+                    patterns=_get_cached_patterns(entity),
+                )
+                for entity in BUNDLE_ENTITIES
+                if _get_cached_patterns(entity)
+            ]
+        )
+
+        texts = [path.read_text(encoding="utf-8") for path in SAMPLES_DIR.glob("*.txt")]
+        texts += [
+            SAMPLE_TEXT,
+            # Overlapping phone, account and transaction formats
+            "Call 416-555-0199 or 4165550199; acct 12345-678-9012345 ref 4165550199",
+            "DOB: 1984-03-12, date of birth 03/12/1984, Ontario ON M5V 2T6",
+            # Non-ASCII text skips the prefilter
+            "Émile vit au 42 Rue Saint-Denis, Montréal, Québec H2X 1K4, tél. 514-555-0123",
+            "",
+        ]
+        cases = [
+            (BUNDLE_ENTITIES, None),
+            ([EntityType.PHONE, EntityType.EMAIL], None),
+            (BUNDLE_ENTITIES, ["phone", "mrn", "email", "account"]),
+        ]
+
+        def key(results):
+            return [
+                (
+                    r.entity_type,
+                    r.start,
+                    r.end,
+                    r.score,
+                    r.recognition_metadata[r.RECOGNIZER_NAME_KEY],
+                )
+                for r in results
+            ]
+
+        for text in texts:
+            for entities, context in cases:
+                with self.subTest(text=text[:40], entities=entities, context=context):
+                    expected = per_entity.analyze(
+                        text=text, entities=entities, language="en", context=context
+                    )
+                    actual = bundled.analyze(
+                        text=text, entities=entities, language="en", context=context
+                    )
+                    self.assertEqual(key(actual), key(expected))
+
+
+def baseline_card_check(pattern_text):
+    """Credit card validation as the baseline recognizer performed it."""
+    digits = pattern_text.replace("-", "").replace(" ", "")
+    if not (13 <= len(digits) <= 19):
+        return False
+    if digits[0] not in ["4", "5", "6", "3"]:
+        return False
+    return True
+
+
+class CreditCardRecognizerTest(unittest.TestCase):
+    def test_matches_baseline_acceptance(self):
+        recognizer = CreditCardRecognizer()
+        cases = [
+            "4111 1111 1111 1111",
+            "5500-0000-0000-0004",
+            "3400 0000 0000 009",
+            "6011-0000 0000-0004",
+            "1234 5678 9012 3456",
+            "4111 1111 1111",
+            "4111 1111 1111 1111 1111",
+            "4111\t1111\t1111\t1111",
+            "٤١١١ ١١١١ ١١١١ ١١١١",
+            "4111 1111 1111 111x",
+            "",
+            "----",
+        ]
+        for text in cases:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    recognizer.validate_result(text), baseline_card_check(text)
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
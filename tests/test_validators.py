@@ -0,0 +1,192 @@
+# tests/test_validators.py
+
+"""Tests for the provincial health number validation logic."""
+
+import random
+import re
+import unittest
+
+from redaction.logic.validators import ValidationLogic, get_validator
+
+BASELINE_NON_DIGIT = re.compile(r"[^0-9]")
+BASELINE_NON_ALPHANUM = re.compile(r"[^A-Z0-9]")
+
+# Characters random health number candidates are built from
+CANDIDATE_CHARS = "0123456789012345678901234567890123456789 -./AHxé٤４"
+
+
+def baseline_luhn(digits):
+    """Luhn check as the baseline per-digit loop computed it."""
+    if not digits.isdigit():
+        return False
+    total = 0
+    for i, digit in enumerate(reversed(digits)):
+        n = int(digit)
+        if i % 2 == 1:
+            n *= 2
+            if n > 9:
+                n -= 9
+        total += n
+    return total % 10 == 0
+
+
+class LuhnCheckTest(unittest.TestCase):
+    def test_known_numbers(self):
+        valid = ["4111111111111111", "5500000000000004", "340000000000009", "0"]
+        invalid = ["4111111111111112", "5500000000000005", "1234567890", "1"]
+        for digits in valid:
+            with self.subTest(digits=digits):
+                self.assertTrue(ValidationLogic.luhn_check(digits))
+        for digits in invalid:
+            with self.subTest(digits=digits):
+                self.assertFalse(ValidationLogic.luhn_check(digits))
+
+    def test_matches_baseline_loop(self):
+        rng = random.Random(3)
+        for _ in range(5000):
+            digits = "".join(
+                rng.choice("0123456789") for _ in range(rng.randint(1, 20))
+            )
+            self.assertEqual(
+                ValidationLogic.luhn_check(digits), baseline_luhn(digits), digits
+            )
+
+    def test_rejects_non_digits(self):
+        for text in ["", "4111 1111 1111 1111", "4111-1111", "411a"]:
+            with self.subTest(text=text):
+                self.assertFalse(ValidationLogic.luhn_check(text))
+
+    def test_rejects_non_ascii_digits(self):
+        # str.isdigit() accepts these, but they have no entry in the ASCII
+        # lookup tables; callers pass strip_non_digits() output
+        for text in ["٤١١١١١١١١١١١١١١١", "４１１１１１１１１１１１１１１１", "²"]:
+            with self.subTest(text=text):
+                self.assertTrue(text.isdigit())
+                self.assertFalse(ValidationLogic.luhn_check(text))
+
+
+def random_candidates(seed, count):
+    """Yields health number candidates with separators and stray characters."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(CANDIDATE_CHARS) for _ in range(rng.randint(0, 16)))
+
+
+def baseline_luhn_of_length(text, length):
+    """Digit count and Luhn check as the baseline validators performed them."""
+    digits = BASELINE_NON_DIGIT.sub("", text)
+    if len(digits) != length:
+        return False
+    return baseline_luhn(digits)
+
+
+class LuhnOfLengthTest(unittest.TestCase):
+    def test_known_numbers(self):
+        self.assertTrue(ValidationLogic.luhn_of_length("9876-543-217", 10))
+        self.assertTrue(ValidationLogic.luhn_of_length(" 987 654 3217 ", 10))
+        self.assertFalse(ValidationLogic.luhn_of_length("9876-543-218", 10))
+        self.assertFalse(ValidationLogic.luhn_of_length("9876-543-217", 9))
+        self.assertFalse(ValidationLogic.luhn_of_length("", 0))
+
+    def test_matches_baseline(self):
+        for text in random_candidates(5, 5000):
+            for length in (9, 10):
+                self.assertEqual(
+                    ValidationLogic.luhn_of_length(text, length),
+                    baseline_luhn_of_length(text, length),
+                    (text, length),
+                )
+
+    def test_luhn_validators_match_baseline(self):
+        lengths = {"ON": 10, "BC": 10, "AB": 9, "SK": 9, "NS": 10, "NB": 9}
+        for province, length in lengths.items():
+            validator = get_validator(province)
+            with self.subTest(province=province):
+                for text in random_candidates(13, 2000):
+                    self.assertEqual(
+                        validator.validate(text),
+                        baseline_luhn_of_length(text, length),
+                        text,
+                    )
+
+    def test_manitoba_and_pei_match_baseline(self):
+        def baseline_mb(text):
+            sanitized = BASELINE_NON_ALPHANUM.sub("", text.upper())
+            if re.match(r"^[A-Z]\d{5}$", sanitized):
+                return True
+            return baseline_luhn_of_length(text, 9)
+
+        def baseline_pe(text):
+            digits = BASELINE_NON_DIGIT.sub("", text)
+            if not digits.isdigit():
+                return False
+            return len(digits) in (8, 10) and baseline_luhn(digits)
+
+        for province, baseline in (("MB", baseline_mb), ("PE", baseline_pe)):
+            validator = get_validator(province)
+            with self.subTest(province=province):
+                for text in random_candidates(17, 2000):
+                    self.assertEqual(validator.validate(text), baseline(text), text)
+                self.assertEqual(validator.validate("H12345"), baseline("H12345"))
+
+
+class StripNonDigitsTest(unittest.TestCase):
+    def test_keeps_only_ascii_digits(self):
+        self.assertEqual(ValidationLogic.strip_non_digits("123-456 789"), "123456789")
+        self.assertEqual(ValidationLogic.strip_non_digits("A1b2.C3/"), "123")
+        self.assertEqual(ValidationLogic.strip_non_digits("٤١١١ ４１-2"), "2")
+        self.assertEqual(ValidationLogic.strip_non_digits(""), "")
+
+    def test_matches_baseline_regex(self):
+        for text in random_candidates(19, 5000):
+            self.assertEqual(
+                ValidationLogic.strip_non_digits(text),
+                BASELINE_NON_DIGIT.sub("", text),
+                text,
+            )
+
+    def test_digit_count_validators_match_baseline(self):
+        def digits_of(text):
+            return BASELINE_NON_DIGIT.sub("", text)
+
+        baselines = {
+            "NL": lambda text: len(digits_of(text)) == 12,
+            "NU": lambda text: len(digits_of(text)) == 9
+            and digits_of(text).startswith("1"),
+            "YT": lambda text: len(digits_of(text)) == 9,
+        }
+        for province, baseline in baselines.items():
+            validator = get_validator(province)
+            with self.subTest(province=province):
+                for text in random_candidates(23, 3000):
+                    self.assertEqual(validator.validate(text), baseline(text), text)
+                for text in ("1234-5678-9012", "123 456 789", "223456789"):
+                    self.assertEqual(validator.validate(text), baseline(text), text)
+
+
+class GetValidatorTest(unittest.TestCase):
+    def test_instances_shared_per_code_and_keywords(self):
+        keywords = ("ohip", "health card")
+        first = get_validator("ON", keywords)
+        self.assertIs(get_validator("ON", tuple(keywords)), first)
+        self.assertEqual(first.context_keywords(), ["ohip", "health card"])
+        self.assertIsNot(get_validator("ON", ("ohip",)), first)
+        self.assertIsNot(get_validator("ON"), first)
+        self.assertIsNot(get_validator("BC", keywords), first)
+
+    def test_no_keywords(self):
+        self.assertEqual(get_validator("QC").context_keywords(), [])
+        self.assertIs(get_validator("QC", None), get_validator("QC"))
+        self.assertIs(get_validator("QC", ()), get_validator("QC"))
+
+    def test_keywords_must_be_hashable(self):
+        with self.assertRaises(TypeError):
+            get_validator("ON", ["ohip"])
+
+    def test_unknown_province(self):
+        with self.assertLogs("redaction.logic.validators", "WARNING"):
+            self.assertIsNone(get_validator("ZZ", ("unit-test",)))
+
+
+if __name__ == "__main__":
+    unittest.main()